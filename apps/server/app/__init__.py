@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import api_router
+from .dependencies import bind_services
 from .settings import Settings, get_settings
 from .services.curriculum import CurriculumService
 from .services.lessons import LessonService
@@ -14,18 +15,24 @@ from .services.strands import StrandsRuntime
 
 import logging
 
-# Configure the root strands logger
-logging.getLogger("strands").setLevel(logging.DEBUG)
 
-# Add a handler to see the logs
-logging.basicConfig(
-    format="%(levelname)s | %(name)s | %(message)s", 
-    handlers=[logging.StreamHandler()]
-)
+def _configure_logging(settings: Settings) -> None:
+    logging.basicConfig(
+        format="%(levelname)s | %(name)s | %(message)s",
+        handlers=[logging.StreamHandler()],
+    )
+    # DEBUG on the strands logger is only useful while developing; in
+    # production it adds per-call formatting cost on every agent invocation.
+    logging.getLogger("strands").setLevel(
+        logging.INFO if settings.environment == "production" else logging.DEBUG,
+    )
+
 
 def create_app(settings: Settings | None = None) -> FastAPI:
     settings = settings or get_settings()
 
+    _configure_logging(settings)
+
     app = FastAPI(
         title="Graspy API",
         version="0.1.0",
@@ -34,7 +41,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         openapi_url="/api/openapi.json",
     )
 
-    allow_origins = settings.cors_origins or ["*"]
+    allow_origins = tuple(settings.cors_origins) if settings.cors_origins else ("*",)
 
     app.add_middleware(
         CORSMiddleware,
@@ -53,6 +60,16 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.state.subject_service = SubjectService(runtime=strands_runtime)
     app.state.tutor_service = TutorService(runtime=strands_runtime)
 
+    bind_services(
+        settings=settings,
+        strands_runtime=strands_runtime,
+        user_service=app.state.user_service,
+        curriculum_service=app.state.curriculum_service,
+        lesson_service=app.state.lesson_service,
+        subject_service=app.state.subject_service,
+        tutor_service=app.state.tutor_service,
+    )
+
     app.include_router(api_router, prefix="/api")
 
     return app
@@ -1,19 +1,15 @@
 from __future__ import annotations
 
-import asyncio
-import contextlib
-import json
-
-from fastapi import APIRouter, Depends, Query, Response, HTTPException
+from fastapi import APIRouter, Query, Response, HTTPException
 from sse_starlette.sse import EventSourceResponse
 
 from ..dependencies import (
-    get_curriculum_service,
-    get_lesson_service,
-    get_settings,
-    get_subject_service,
-    get_tutor_service,
-    get_user_service,
+    CurriculumServiceDep,
+    LessonServiceDep,
+    SettingsDep,
+    SubjectServiceDep,
+    TutorServiceDep,
+    UserServiceDep,
 )
 from ..schemas import (
     CurriculumRequest,
@@ -23,6 +19,7 @@ from ..schemas import (
     HealthResponse,
     LessonRequest,
     LessonResponse,
+    LessonStreamEvent,
     SubjectGenerationRequest,
     SubjectStreamEvent,
     TutorChatRequest,
@@ -31,20 +28,32 @@ from ..schemas import (
     UserCreate,
     UserUpdate,
 )
-from ..services.curriculum import CurriculumService
-from ..services.lessons import LessonService
-from ..services.subjects import SubjectService
-from ..services.tutor import TutorService
-from ..services.users import UserService
-from ..settings import Settings
 
 api_router = APIRouter()
 
+# NOTE: every SSE event_publisher below must stay an `async def` generator.
+# Handing a sync generator to EventSourceResponse/StreamingResponse silently
+# moves iteration onto Starlette's threadpool, which is dramatically slower.
+
 CACHE_CONTROL_HEADER = "public, max-age=3600"
 
+# Terminal SSE frames never change, so build them once instead of per stream.
+_DONE_EVENT = {"data": "[DONE]"}
+_SUBJECTS_DONE_EVENT = {"event": "message", "data": "[DONE]"}
+
+# Error-frame templates: model_copy(update=...) fills in the message without
+# re-running validation on the constant fields.
+_CURRICULUM_ERROR_TEMPLATE = CurriculumStreamEvent(
+    subjects=[],
+    topics={},
+    currentStep="error",
+    error="",
+)
+_LESSON_ERROR_TEMPLATE = LessonStreamEvent(type="error", phase="error", message="")
+
 
 @api_router.get("/health", response_model=HealthResponse, tags=["meta"])
-async def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
+async def health(settings: SettingsDep) -> HealthResponse:
     return HealthResponse(
         status="ok",
         details={
@@ -55,7 +64,7 @@ async def health(settings: Settings = Depends(get_settings)) -> HealthResponse:
 
 
 @api_router.get("/users/all", response_model=UsersResponse, tags=["users"])
-async def list_users(user_service: UserService = Depends(get_user_service)) -> UsersResponse:
+async def list_users(user_service: UserServiceDep) -> UsersResponse:
     users = await user_service.list_users()
     return UsersResponse(users=users)
 
@@ -63,7 +72,7 @@ async def list_users(user_service: UserService = Depends(get_user_service)) -> U
 @api_router.post("/users/add", status_code=201, tags=["users"])
 async def add_user(
     payload: UserCreate,
-    user_service: UserService = Depends(get_user_service),
+    user_service: UserServiceDep,
 ) -> Response:
     await user_service.add_user(payload)
     return Response(status_code=201)
@@ -72,7 +81,7 @@ async def add_user(
 @api_router.put("/users/update", status_code=200, tags=["users"])
 async def update_user(
     payload: UserUpdate,
-    user_service: UserService = Depends(get_user_service),
+    user_service: UserServiceDep,
 ) -> Response:
     await user_service.update_user(payload)
     return Response(status_code=200)
@@ -81,7 +90,7 @@ async def update_user(
 @api_router.delete("/users/delete/{user_id}", status_code=200, tags=["users"])
 async def delete_user(
     user_id: int,
-    user_service: UserService = Depends(get_user_service),
+    user_service: UserServiceDep,
 ) -> Response:
     await user_service.delete_user(user_id)
     return Response(status_code=200)
@@ -95,9 +104,11 @@ async def delete_user(
 )
 async def tutor_chat(
     payload: TutorChatRequest,
-    tutor_service: TutorService = Depends(get_tutor_service),
+    tutor_service: TutorServiceDep,
 ) -> TutorChatResponse:
-    if not payload.message.strip() or not payload.subject.strip() or not payload.language.strip():
+    # isspace fails fast on the first non-blank character without allocating
+    # stripped copies of each field.
+    if any(not value or value.isspace() for value in (payload.message, payload.subject, payload.language)):
         raise HTTPException(status_code=400, detail="message, subject, and language are required")
 
     return await tutor_service.chat(payload)
@@ -111,7 +122,7 @@ async def tutor_chat(
 )
 async def generate_curriculum(
     payload: CurriculumRequest,
-    curriculum_service: CurriculumService = Depends(get_curriculum_service),
+    curriculum_service: CurriculumServiceDep,
 ) -> CurriculumResponse:
     response = await curriculum_service.generate_curriculum(payload)
     return response
@@ -123,62 +134,39 @@ async def generate_curriculum(
     tags=["curriculum"],
 )
 async def generate_curriculum_stream(
+    curriculum_service: CurriculumServiceDep,
     country: str = Query(...),
     language: str = Query(...),
     grade_level: str | None = Query(None, alias="gradeLevel"),
     subjects: list[str] | None = Query(None, alias="subject"),
-    curriculum_service: CurriculumService = Depends(get_curriculum_service),
 ) -> EventSourceResponse:
-    request_payload = CurriculumRequest(
+    # Query params are already validated by FastAPI, so skip re-validation.
+    request_payload = CurriculumRequest.model_construct(
         country=country,
         language=language,
-        gradeLevel=grade_level,
+        grade_level=grade_level,
         subjects=subjects,
     )
 
     async def event_publisher():
-        queue: asyncio.Queue[dict | None] = asyncio.Queue()
-
-        async def pump_stream():
-            try:
-                async for event in curriculum_service.stream_curriculum(request_payload):
-                    await queue.put(
-                        {
-                            "event": "message",
-                            "data": json.dumps(event.model_dump(by_alias=True, exclude_none=True)),
-                        },
-                    )
-            finally:
-                await queue.put(None)
-
-        async def heartbeat():
-            try:
-                while True:
-                    await asyncio.sleep(20)
-                    await queue.put({"event": "ping", "data": "keepalive"})
-            except asyncio.CancelledError:
-                pass
-
-        producer = asyncio.create_task(pump_stream())
-        ping_task = asyncio.create_task(heartbeat())
-
         try:
-            while True:
-                item = await queue.get()
-                if item is None:
-                    yield {"data": "[DONE]"}
-                    break
-                yield item
-        finally:
-            producer.cancel()
-            ping_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await producer
-            with contextlib.suppress(asyncio.CancelledError):
-                await ping_task
+            async for event in curriculum_service.stream_curriculum(request_payload):
+                yield {
+                    "event": "message",
+                    "data": event.model_dump_json(by_alias=True, exclude_none=True),
+                }
+        except Exception as exc:  # noqa: BLE001
+            yield {
+                "event": "message",
+                "data": _CURRICULUM_ERROR_TEMPLATE.model_copy(
+                    update={"error": str(exc) or "Curriculum stream failed"},
+                ).model_dump_json(by_alias=True, exclude_none=True),
+            }
+        yield _DONE_EVENT
 
     return EventSourceResponse(
         event_publisher(),
+        ping=20,
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
@@ -195,7 +183,7 @@ async def generate_curriculum_stream(
 async def generate_lesson(
     payload: LessonRequest,
     response: Response,
-    lesson_service: LessonService = Depends(get_lesson_service),
+    lesson_service: LessonServiceDep,
 ) -> LessonResponse:
     result = await lesson_service.generate_lesson(payload)
     response.headers["Cache-Control"] = CACHE_CONTROL_HEADER
@@ -211,11 +199,11 @@ async def generate_lesson(
 )
 async def get_lesson(
     response: Response,
-    lesson_service: LessonService = Depends(get_lesson_service),
-    country: str = Query(...),
-    language: str = Query(...),
-    subject: str = Query(...),
-    topic: str = Query(...),
+    lesson_service: LessonServiceDep,
+    country: str = Query(..., min_length=1),
+    language: str = Query(..., min_length=1),
+    subject: str = Query(..., min_length=1),
+    topic: str = Query(..., min_length=1),
     grade_level: str | None = Query(None, alias="gradeLevel"),
     grade: str | None = Query(None, alias="grade"),
     index: int = Query(0),
@@ -223,14 +211,14 @@ async def get_lesson(
 ) -> LessonResponse:
     final_grade_level = grade_level or grade
 
-    lesson_request = LessonRequest(
+    lesson_request = LessonRequest.model_construct(
         country=country,
         language=language,
         subject=subject,
         topic=topic,
-        gradeLevel=final_grade_level,
-        topicIndex=index,
-        totalTopics=total_topics,
+        grade_level=final_grade_level,
+        topic_index=index,
+        total_topics=total_topics,
     )
 
     result = await lesson_service.generate_lesson(lesson_request)
@@ -249,11 +237,11 @@ async def get_lesson(
     tags=["lessons"],
 )
 async def stream_lesson(
-    lesson_service: LessonService = Depends(get_lesson_service),
-    country: str = Query(...),
-    language: str = Query(...),
-    subject: str = Query(...),
-    topic: str = Query(...),
+    lesson_service: LessonServiceDep,
+    country: str = Query(..., min_length=1),
+    language: str = Query(..., min_length=1),
+    subject: str = Query(..., min_length=1),
+    topic: str = Query(..., min_length=1),
     grade_level: str | None = Query(None, alias="gradeLevel"),
     grade: str | None = Query(None, alias="grade"),
     index: int = Query(0),
@@ -261,85 +249,42 @@ async def stream_lesson(
 ) -> EventSourceResponse:
     final_grade_level = grade_level or grade
 
-    request_payload = LessonRequest(
+    request_payload = LessonRequest.model_construct(
         country=country,
         language=language,
         subject=subject,
         topic=topic,
-        gradeLevel=final_grade_level,
-        topicIndex=index,
-        totalTopics=total_topics,
+        grade_level=final_grade_level,
+        topic_index=index,
+        total_topics=total_topics,
     )
 
     async def event_publisher():
-        queue: asyncio.Queue[dict | None] = asyncio.Queue()
-
-        async def pump_stream():
-            try:
-                async for event in lesson_service.stream_lesson(request_payload):
-                    await queue.put(
-                        {
-                            "event": "message",
-                            "data": event.model_dump_json(by_alias=True, exclude_none=True),
-                        },
-                    )
-            except HTTPException as exc:
-                await queue.put(
-                    {
-                        "event": "message",
-                        "data": json.dumps(
-                            {
-                                "type": "error",
-                                "phase": "error",
-                                "message": exc.detail if isinstance(exc.detail, str) else "Lesson stream failed",
-                            },
-                        ),
-                    },
-                )
-            except Exception as exc:  # noqa: BLE001
-                await queue.put(
-                    {
-                        "event": "message",
-                        "data": json.dumps(
-                            {
-                                "type": "error",
-                                "phase": "error",
-                                "message": str(exc) or "Lesson stream failed",
-                            },
-                        ),
-                    },
-                )
-            finally:
-                await queue.put(None)
-
-        async def heartbeat():
-            try:
-                while True:
-                    await asyncio.sleep(20)
-                    await queue.put({"event": "ping", "data": "keepalive"})
-            except asyncio.CancelledError:
-                pass
-
-        producer = asyncio.create_task(pump_stream())
-        ping_task = asyncio.create_task(heartbeat())
-
         try:
-            while True:
-                item = await queue.get()
-                if item is None:
-                    yield {"data": "[DONE]"}
-                    break
-                yield item
-        finally:
-            producer.cancel()
-            ping_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await producer
-            with contextlib.suppress(asyncio.CancelledError):
-                await ping_task
+            async for event in lesson_service.stream_lesson(request_payload):
+                yield {
+                    "event": "message",
+                    "data": event.model_dump_json(by_alias=True, exclude_none=True),
+                }
+        except HTTPException as exc:
+            yield {
+                "event": "message",
+                "data": _LESSON_ERROR_TEMPLATE.model_copy(
+                    update={"message": exc.detail if isinstance(exc.detail, str) else "Lesson stream failed"},
+                ).model_dump_json(by_alias=True, exclude_none=True),
+            }
+        except Exception as exc:  # noqa: BLE001
+            yield {
+                "event": "message",
+                "data": _LESSON_ERROR_TEMPLATE.model_copy(
+                    update={"message": str(exc) or "Lesson stream failed"},
+                ).model_dump_json(by_alias=True, exclude_none=True),
+            }
+        yield _DONE_EVENT
 
     return EventSourceResponse(
         event_publisher(),
+        ping=20,
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
@@ -352,6 +297,7 @@ async def stream_lesson(
     tags=["subjects"],
 )
 async def generate_subjects_stream(
+    subject_service: SubjectServiceDep,
     country: str = Query(...),
     language: str = Query(...),
     education_status: str = Query(..., alias="educationStatus"),
@@ -359,15 +305,14 @@ async def generate_subjects_stream(
     school_grade: str | None = Query(None, alias="schoolGrade"),
     age_range: str | None = Query(None, alias="ageRange"),
     interests: list[str] | None = Query(None, alias="interest"),
-    subject_service: SubjectService = Depends(get_subject_service),
 ) -> EventSourceResponse:
-    request_payload = SubjectGenerationRequest(
+    request_payload = SubjectGenerationRequest.model_construct(
         country=country,
         language=language,
-        educationStatus=education_status,
-        gradeLevel=grade_level,
-        schoolGrade=school_grade,
-        ageRange=age_range,
+        education_status=education_status,
+        grade_level=grade_level,
+        school_grade=school_grade,
+        age_range=age_range,
         interests=interests,
     )
 
@@ -375,12 +320,13 @@ async def generate_subjects_stream(
         async for event in subject_service.stream_subjects(request_payload):
             yield {
                 "event": "message",
-                "data": event.model_dump_json(by_alias=True),
+                "data": event.model_dump_json(by_alias=True, exclude_none=True),
             }
-        yield {"event": "message", "data": "[DONE]"}
+        yield _SUBJECTS_DONE_EVENT
 
     return EventSourceResponse(
         event_publisher(),
+        ping=20,
         headers={
             "Cache-Control": "no-cache",
             "X-Accel-Buffering": "no",
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from fastapi import Request
+from typing import Annotated
+
+from fastapi import Depends
 
 from .services.curriculum import CurriculumService
 from .services.lessons import LessonService
@@ -10,30 +12,81 @@ from .services.tutor import TutorService
 from .services.strands import StrandsRuntime
 from .settings import Settings
 
+# Services are app-lifetime singletons bound once by create_app; reading them
+# from module globals avoids the request.app.state attribute walk per request.
+_settings: Settings | None = None
+_strands_runtime: StrandsRuntime | None = None
+_user_service: UserService | None = None
+_curriculum_service: CurriculumService | None = None
+_lesson_service: LessonService | None = None
+_subject_service: SubjectService | None = None
+_tutor_service: TutorService | None = None
+
+
+def bind_services(
+    *,
+    settings: Settings,
+    strands_runtime: StrandsRuntime,
+    user_service: UserService,
+    curriculum_service: CurriculumService,
+    lesson_service: LessonService,
+    subject_service: SubjectService,
+    tutor_service: TutorService,
+) -> None:
+    """Register the singletons built by create_app for dependency lookup."""
+    global _settings, _strands_runtime, _user_service, _curriculum_service
+    global _lesson_service, _subject_service, _tutor_service
+
+    _settings = settings
+    _strands_runtime = strands_runtime
+    _user_service = user_service
+    _curriculum_service = curriculum_service
+    _lesson_service = lesson_service
+    _subject_service = subject_service
+    _tutor_service = tutor_service
+
+
+def get_settings() -> Settings:
+    assert _settings is not None, "create_app() has not bound services yet"
+    return _settings
+
 
-def get_settings(request: Request) -> Settings:
-    return request.app.state.settings
+def get_user_service() -> UserService:
+    assert _user_service is not None, "create_app() has not bound services yet"
+    return _user_service
 
 
-def get_user_service(request: Request) -> UserService:
-    return request.app.state.user_service
+def get_curriculum_service() -> CurriculumService:
+    assert _curriculum_service is not None, "create_app() has not bound services yet"
+    return _curriculum_service
 
 
-def get_curriculum_service(request: Request) -> CurriculumService:
-    return request.app.state.curriculum_service
+def get_lesson_service() -> LessonService:
+    assert _lesson_service is not None, "create_app() has not bound services yet"
+    return _lesson_service
 
 
-def get_lesson_service(request: Request) -> LessonService:
-    return request.app.state.lesson_service
+def get_strands_runtime() -> StrandsRuntime:
+    assert _strands_runtime is not None, "create_app() has not bound services yet"
+    return _strands_runtime
 
 
-def get_strands_runtime(request: Request) -> StrandsRuntime:
-    return request.app.state.strands_runtime
+def get_subject_service() -> SubjectService:
+    assert _subject_service is not None, "create_app() has not bound services yet"
+    return _subject_service
 
 
-def get_subject_service(request: Request) -> SubjectService:
-    return request.app.state.subject_service
+def get_tutor_service() -> TutorService:
+    assert _tutor_service is not None, "create_app() has not bound services yet"
+    return _tutor_service
 
 
-def get_tutor_service(request: Request) -> TutorService:
-    return request.app.state.tutor_service
+# Annotated aliases so routes reuse a single resolved dependency instead of
+# re-declaring Depends(...) per endpoint.
+SettingsDep = Annotated[Settings, Depends(get_settings)]
+UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+CurriculumServiceDep = Annotated[CurriculumService, Depends(get_curriculum_service)]
+LessonServiceDep = Annotated[LessonService, Depends(get_lesson_service)]
+StrandsRuntimeDep = Annotated[StrandsRuntime, Depends(get_strands_runtime)]
+SubjectServiceDep = Annotated[SubjectService, Depends(get_subject_service)]
+TutorServiceDep = Annotated[TutorService, Depends(get_tutor_service)]
@@ -8,6 +8,8 @@ app = create_app()
 
 def main() -> None:
     """Start the FastAPI application using uvicorn with settings from Settings class."""
+    import sys
+
     import uvicorn
 
     settings = get_settings()
@@ -17,6 +19,12 @@ def main() -> None:
         host=settings.host,
         port=settings.port,
         reload=settings.uvicorn_reload,
+        # uvloop and httptools ship with uvicorn[standard] and outperform the
+        # stdlib loop and h11 parser on streaming workloads; uvloop has no
+        # Windows support, so fall back to the default loop there.
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        workers=settings.workers,
     )
 
 
@@ -1,41 +1,73 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Literal
 
-from pydantic import BaseModel, Field, PositiveInt
+from pydantic import BaseModel, ConfigDict, Field, PositiveInt, field_validator
+
+
+class AliasModel(BaseModel):
+    """Base for models populated by field name or camelCase alias."""
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class StrictAliasModel(AliasModel):
+    """AliasModel variant that rejects unknown fields."""
+
+    model_config = ConfigDict(extra="forbid")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class User(BaseModel):
     id: PositiveInt
     name: str
     email: str
-    created: datetime = Field(default_factory=datetime.utcnow)
+    created: datetime = Field(default_factory=_utcnow)
 
 
-class UserCreate(BaseModel):
+class _UserFieldsMixin(BaseModel):
+    """Normalizes name/email at validation time so the user store can
+    trust the values as-is."""
+
     name: str
     email: str
 
+    @field_validator("name", mode="after")
+    @classmethod
+    def _normalize_name(cls, value: str) -> str:
+        return value.strip()
+
+    @field_validator("email", mode="after")
+    @classmethod
+    def _normalize_email(cls, value: str) -> str:
+        return value.strip().lower()
 
-class UserUpdate(BaseModel):
+
+class UserCreate(_UserFieldsMixin):
+    pass
+
+
+class UserUpdate(_UserFieldsMixin):
     id: PositiveInt
-    name: str
-    email: str
 
 
 class UsersResponse(BaseModel):
     users: List[User]
 
 
-class CurriculumRequest(BaseModel):
+class CurriculumRequest(AliasModel):
     country: str
     language: str
     grade_level: Optional[str] = Field(default=None, alias="gradeLevel")
     subjects: Optional[List[str]] = None
+    topics: Optional[Dict[str, List[str]]] = None
 
     model_config = {
-        "populate_by_name": True,
         "json_schema_extra": {
             "example": {
                 "country": "Nigeria",
@@ -52,42 +84,35 @@ class CurriculumSubject(BaseModel):
     slug: str
 
 
-class CurriculumResponse(BaseModel):
+class CurriculumResponse(AliasModel):
     subjects: List[CurriculumSubject]
     topics: Dict[str, List[str]] = Field(default_factory=dict)
     current_step: str = Field(alias="currentStep")
     error: Optional[str] = None
 
-    model_config = {"populate_by_name": True}
-
 
 class CurriculumStreamEvent(CurriculumResponse):
     pass
 
 
-class CurriculumSubjects(BaseModel):
+class CurriculumSubjects(StrictAliasModel):
     subjects: List[str] = Field(min_length=3, max_length=12)
 
-    model_config = {"extra": "forbid"}
-
 
-class CurriculumTopics(BaseModel):
+class CurriculumTopics(StrictAliasModel):
     topics: List[str] = Field(min_length=5, max_length=7)
 
-    model_config = {"extra": "forbid"}
 
-
-class LessonRequest(BaseModel):
-    country: str
-    language: str
-    subject: str
-    topic: str
+class LessonRequest(AliasModel):
+    country: str = Field(min_length=1)
+    language: str = Field(min_length=1)
+    subject: str = Field(min_length=1)
+    topic: str = Field(min_length=1)
     grade_level: Optional[str] = Field(default=None, alias="gradeLevel")
     topic_index: int = Field(default=0, alias="topicIndex")
     total_topics: int = Field(default=1, alias="totalTopics")
 
     model_config = {
-        "populate_by_name": True,
         "json_schema_extra": {
             "example": {
                 "country": "Kenya",
@@ -102,17 +127,15 @@ class LessonRequest(BaseModel):
     }
 
 
-class LessonPractice(BaseModel):
+class LessonPractice(StrictAliasModel):
     question: str
     options: List[str] = Field(min_length=3, max_length=3)
     answer_index: int = Field(alias="answerIndex")
     correct_feedback: str = Field(alias="correctFeedback")
     incorrect_feedback: str = Field(alias="incorrectFeedback")
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
 
-
-class LessonSlideAssessment(BaseModel):
+class LessonSlideAssessment(StrictAliasModel):
     type: Literal["choice"] = "choice"
     prompt: str
     options: List[str] = Field(min_length=3, max_length=3)
@@ -120,10 +143,8 @@ class LessonSlideAssessment(BaseModel):
     correct_feedback: str = Field(alias="correctFeedback")
     incorrect_feedback: str = Field(alias="incorrectFeedback")
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
-
 
-class LessonSlide(BaseModel):
+class LessonSlide(StrictAliasModel):
     slide_type: Literal[
         "concept_introduction",
         "worked_example",
@@ -135,25 +156,21 @@ class LessonSlide(BaseModel):
     body_md: str = Field(alias="bodyMd")
     assessment: LessonSlideAssessment
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
-
 
 class LessonProgress(BaseModel):
     current: int
     total: int
 
 
-class LessonMetadata(BaseModel):
+class LessonMetadata(AliasModel):
     country: str
     language: str
     grade_level: Optional[str] = Field(default=None, alias="gradeLevel")
     generator: str
     learning_objectives: List[str] = Field(default_factory=list, alias="learningObjectives")
 
-    model_config = {"populate_by_name": True}
-
 
-class LessonSession(BaseModel):
+class LessonSession(AliasModel):
     id: str
     subject: str
     topic: str
@@ -165,10 +182,8 @@ class LessonSession(BaseModel):
     phase: str
     metadata: LessonMetadata
 
-    model_config = {"populate_by_name": True}
-
 
-class LessonPayload(BaseModel):
+class LessonPayload(AliasModel):
     title: str
     content: str
     key_points: List[str] = Field(alias="keyPoints")
@@ -177,8 +192,6 @@ class LessonPayload(BaseModel):
     practice: LessonPractice
     progress: LessonProgress
 
-    model_config = {"populate_by_name": True}
-
 
 class LessonResponse(BaseModel):
     success: bool = True
@@ -186,7 +199,10 @@ class LessonResponse(BaseModel):
     lesson: LessonPayload
 
 
-class LessonStreamEvent(BaseModel):
+class LessonStreamEvent(AliasModel):
+    # Frozen so constant status events can be shared across streams.
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["status", "complete", "error"]
     phase: Optional[
         Literal[
@@ -201,10 +217,8 @@ class LessonStreamEvent(BaseModel):
     message: Optional[str] = None
     data: Optional[LessonResponse] = Field(default=None, alias="payload")
 
-    model_config = {"populate_by_name": True}
 
-
-class LessonSlidesPayload(BaseModel):
+class LessonSlidesPayload(StrictAliasModel):
     overview: str
     learning_objectives: List[str] = Field(
         default_factory=list,
@@ -214,25 +228,19 @@ class LessonSlidesPayload(BaseModel):
     )
     slides: List[LessonSlide] = Field(min_length=5, max_length=5)
 
-    model_config = {"populate_by_name": True, "extra": "forbid"}
-
 
-class LessonPracticePayload(BaseModel):
+class LessonPracticePayload(StrictAliasModel):
     question: str
     options: List[str] = Field(min_length=3, max_length=3)
     correct_option_index: int
     correct_feedback: str
     incorrect_feedback: str
 
-    model_config = {"extra": "forbid"}
-
 
-class LessonAgentResponse(BaseModel):
+class LessonAgentResponse(AliasModel):
     slides: LessonSlidesPayload
     practice: LessonPracticePayload
 
-    model_config = {"populate_by_name": True}
-
 
 class ErrorResponse(BaseModel):
     error: str
@@ -249,7 +257,7 @@ class SubjectCandidate(BaseModel):
     recommended: bool = False
 
 
-class SubjectGenerationRequest(BaseModel):
+class SubjectGenerationRequest(AliasModel):
     country: str
     language: str
     education_status: Literal["in_school", "out_of_school"] = Field(alias="educationStatus")
@@ -258,8 +266,6 @@ class SubjectGenerationRequest(BaseModel):
     age_range: Optional[str] = Field(default=None, alias="ageRange")
     interests: Optional[List[str]] = None
 
-    model_config = {"populate_by_name": True}
-
 
 class SubjectStreamEvent(BaseModel):
     type: Literal["status", "subjects", "error", "complete"]
@@ -267,12 +273,20 @@ class SubjectStreamEvent(BaseModel):
     subjects: Optional[List[SubjectCandidate]] = None
 
 
+# Bounds on the tutor transcript so pasted walls of text cannot blow the
+# prompt's token budget: per-turn cap plus a total budget trimmed oldest-first.
+_MAX_TURN_CHARS = 512
+_TOTAL_HISTORY_CHAR_BUDGET = 4000
+
+
 class TutorChatHistoryEntry(BaseModel):
     role: Literal["user", "assistant"]
     content: str
 
+    model_config = ConfigDict(str_strip_whitespace=True)
+
 
-class TutorChatRequest(BaseModel):
+class TutorChatRequest(AliasModel):
     message: str
     subject: str
     topic: Optional[str] = None
@@ -283,7 +297,7 @@ class TutorChatRequest(BaseModel):
     history: Optional[List[TutorChatHistoryEntry]] = None
 
     model_config = {
-        "populate_by_name": True,
+        "str_strip_whitespace": True,
         "json_schema_extra": {
             "example": {
                 "message": "Can you explain photosynthesis again?",
@@ -301,10 +315,26 @@ class TutorChatRequest(BaseModel):
         },
     }
 
+    @cached_property
+    def related_topics_text(self) -> str:
+        """Prompt-ready related topics, computed once per request."""
+        return ", ".join(self.related_topics or []) or "None"
+
+    @cached_property
+    def history_text(self) -> str:
+        """Prompt-ready transcript of the last eight turns, size-bounded."""
+        turns = [
+            f"{'Graspy' if entry.role == 'assistant' else 'Learner'}: {entry.content[:_MAX_TURN_CHARS]}"
+            for entry in (self.history or [])[-8:]
+        ]
+        total = sum(len(turn) + 1 for turn in turns)
+        while turns and total > _TOTAL_HISTORY_CHAR_BUDGET:
+            total -= len(turns.pop(0)) + 1
+        return "\n".join(turns) or "None"
+
 
-class TutorChatResponse(BaseModel):
+class TutorChatResponse(AliasModel):
     answer: str
     follow_ups: Optional[List[str]] = Field(default=None, alias="followUps")
     navigation_tip: Optional[str] = Field(default=None, alias="navigationTip")
 
-    model_config = {"populate_by_name": True}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import AsyncGenerator, Dict, List
 
@@ -12,9 +13,10 @@ from ..schemas import (
     CurriculumSubject,
 )
 from ..workflows.curriculum import (
+    _TOPIC_CONCURRENCY,
     generate_curriculum_plan,
     generate_subject_list,
-    generate_topic_map,
+    generate_subject_topics,
 )
 from .strands import StrandsRuntime
 
@@ -32,7 +34,8 @@ class CurriculumService:
                 detail="country and language are required",
             )
 
-        logger.debug("Generating curriculum", extra={"country": request.country, "language": request.language})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generating curriculum", extra={"country": request.country, "language": request.language})
 
         try:
             subjects, topics = await generate_curriculum_plan(self._runtime, request)
@@ -71,7 +74,8 @@ class CurriculumService:
         )
 
         try:
-            logger.debug("Streaming: generating subjects", extra={"country": request.country, "language": request.language})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Streaming: generating subjects", extra={"country": request.country, "language": request.language})
             subjects = await generate_subject_list(self._runtime, request)
             yield CurriculumStreamEvent(
                 subjects=subjects,
@@ -80,14 +84,37 @@ class CurriculumService:
                 error=None,
             )
 
-            logger.debug("Streaming: generating topics", extra={"subjects": [subject.slug for subject in subjects]})
-            topics = await generate_topic_map(self._runtime, request, subjects)
-            yield CurriculumStreamEvent(
-                subjects=subjects,
-                topics=topics,
-                currentStep="topics_generated",
-                error=None,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Streaming: generating topics", extra={"subjects": [subject.slug for subject in subjects]})
+            # Same per-subject concurrency cap as generate_topic_map, so the
+            # streaming path cannot trip Bedrock throttling either.
+            semaphore = asyncio.Semaphore(_TOPIC_CONCURRENCY)
+
+            async def bounded(subject: CurriculumSubject) -> List[str]:
+                async with semaphore:
+                    return await generate_subject_topics(self._runtime, request, subject)
+
+            tasks = {
+                asyncio.create_task(bounded(subject)): subject
+                for subject in subjects
+            }
+            # Emit partial topic maps as each subject resolves so the client
+            # sees the curriculum fill in subject-by-subject.
+            pending = set(tasks)
+            try:
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        topics[tasks[task].slug] = task.result()
+                    yield CurriculumStreamEvent(
+                        subjects=subjects,
+                        topics=topics,
+                        currentStep="generating_topics" if pending else "topics_generated",
+                        error=None,
+                    )
+            finally:
+                for task in pending:
+                    task.cancel()
         except Exception as exc:  # noqa: BLE001
             logger.exception("Curriculum streaming failed")
             yield CurriculumStreamEvent(
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any, Optional, Sequence, Type, TypeVar
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Optional, Sequence, Type, TypeVar, Union
 from pydantic import BaseModel, ValidationError
 
 from ..settings import Settings
@@ -9,8 +12,48 @@ from ..strands_patches import patch_bedrock_structured_output
 
 patch_bedrock_structured_output()
 
+# Import the SDK once at module load rather than inside make_agent, where the
+# sys.modules lookup and import lock would run on every call. A missing SDK is
+# reported when an agent is first requested, matching the old behaviour.
+try:
+    import boto3  # type: ignore[import-not-found]
+    from botocore.config import Config as _BotoConfig  # type: ignore[import-not-found]
+    from strands import Agent as _Agent  # type: ignore[import-not-found]
+    from strands.models import BedrockModel as _BedrockModel  # type: ignore[import-not-found]
+except Exception:  # noqa: BLE001  # pragma: no cover - import-environment dependent
+    boto3 = None
+    _BotoConfig = None
+    _Agent = None
+    _BedrockModel = None
+
 TModel = TypeVar("TModel", bound=BaseModel)
 
+# Prompts are either plain strings or Bedrock content-block lists (used to
+# mark cache points on large static prompt sections).
+SystemPrompt = Union[str, Sequence[dict]]
+Prompt = Union[str, Sequence[dict]]
+
+
+def cached_system_prompt(text: str) -> list[dict[str, Any]]:
+    """Wrap a static system prompt with a Bedrock cachePoint so repeated
+    calls re-read the prefilled prefix from the provider's prompt cache
+    instead of re-processing it per call."""
+    return [{"text": text}, {"cachePoint": {"type": "default"}}]
+
+
+def _system_prompt_key(system_prompt: SystemPrompt) -> Any:
+    """Hashable pool-key form of a system prompt."""
+    if isinstance(system_prompt, str):
+        return system_prompt
+    return tuple(json.dumps(block, sort_keys=True) for block in system_prompt)
+
+# Shared empty tool list for the common no-tools path; Agent does not mutate
+# the list it is given, so one instance can back every tool-less agent.
+_EMPTY_TOOLS: list = []
+
+# Upper bound on idle agents kept for reuse across structured_output calls.
+_AGENT_POOL_SIZE = 64
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +69,27 @@ class StrandsRuntime:
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
+        # BedrockModel is stateless with respect to prompts and tools, so one
+        # provider per inference configuration can back every agent. Building
+        # it is the expensive part of make_agent (boto3 client + provider
+        # config validation).
+        self._model_cache: dict[tuple[Any, ...], Any] = {}
+        # One boto3 session and client config shared by every Bedrock
+        # provider, so concurrent calls reuse pooled TLS connections and the
+        # resolved credential chain instead of building both per provider.
+        self._boto_session = None
+        self._boto_client_config = None
+        if boto3 is not None:
+            self._boto_session = boto3.Session(region_name=settings.bedrock_region or None)
+            self._boto_client_config = _BotoConfig(
+                max_pool_connections=100,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            )
+        # Idle tool-less agents keyed by (system_prompt, temperature,
+        # max_tokens). Agents carry conversation state, so entries are popped
+        # on checkout and returned only after their messages are cleared;
+        # concurrent calls with the same key simply build a fresh agent.
+        self._agent_pool: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
     @property
     def settings(self) -> Settings:
         return self._settings
@@ -33,9 +97,9 @@ class StrandsRuntime:
     async def structured_output(
         self,
         model: Type[TModel],
-        prompt: str,
+        prompt: Prompt,
         *,
-        system_prompt: str,
+        system_prompt: SystemPrompt,
         tools: Optional[Sequence[Any]] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
@@ -44,86 +108,149 @@ class StrandsRuntime:
         Invoke an agent with the provided system prompt and return a typed
         response using Strands' structured_output API.
         """
-        logger.debug(
-            "Invoking Strands structured_output",
-            extra={
-                "model": model.__name__,
-                "system_prompt_preview": system_prompt[:60],
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Invoking Strands structured_output",
+                extra={
+                    "model": model.__name__,
+                },
+            )
+        pool_key = (_system_prompt_key(system_prompt), temperature, max_tokens) if not tools else None
+        agent = self._agent_pool.pop(pool_key, None) if pool_key is not None else None
+        if agent is None:
+            agent = self.make_agent(
+                system_prompt=system_prompt,
+                tools=tools,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        timeout_s = self._settings.bedrock_call_timeout_s
+        try:
+            # Bound each call so a hung Bedrock connection cannot pin an
+            # event-loop task indefinitely.
+            if not isinstance(prompt, (str, list)):
+                prompt = list(prompt)
+            async with asyncio.timeout(timeout_s):
+                result = await agent.structured_output_async(model, prompt)  # type: ignore[attr-defined]
+        except TimeoutError as exc:
+            msg = f"Bedrock call timed out after {timeout_s:g}s for model '{model.__name__}'"
+            logger.error(msg)
+            raise ValueError(msg) from exc
+        except ValidationError as exc:
+            msg = f"Strands structured output failed validation for model '{model.__name__}'"
+            logger.exception(msg)
+            raise ValueError(msg) from exc
+        # Only a cleanly-finished agent goes back in the pool; one that threw
+        # is discarded since its state is unknown.
+        if pool_key is not None:
+            self._release_agent(pool_key, agent)
+        return result
+
+    def _release_agent(self, pool_key: tuple[Any, ...], agent: Any) -> None:
+        agent.messages = []
+        self._agent_pool[pool_key] = agent
+        while len(self._agent_pool) > _AGENT_POOL_SIZE:
+            self._agent_pool.popitem(last=False)
+
+    async def stream_text(
+        self,
+        prompt: str,
+        *,
+        system_prompt: SystemPrompt,
+        tools: Optional[Sequence[Any]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Invoke an agent and yield response text incrementally as the model
+        produces it, so callers can parse output before the call completes.
+        """
         agent = self.make_agent(
             system_prompt=system_prompt,
             tools=tools,
             temperature=temperature,
             max_tokens=max_tokens,
         )
-        try:
-            return await agent.structured_output_async(model, prompt)  # type: ignore[attr-defined]
-        except ValidationError as exc:
-            msg = f"Strands structured output failed validation for model '{model.__name__}'"
-            logger.exception(msg)
-            raise ValueError(msg) from exc
+        async for event in agent.stream_async(prompt):
+            data = event.get("data") if isinstance(event, dict) else None
+            if data:
+                yield data
 
     def make_agent(
         self,
         *,
-        system_prompt: str,
+        system_prompt: SystemPrompt,
         tools: Optional[Sequence[Any]] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
     ) -> Any:
-        try:
-            from strands import Agent  # type: ignore[import-not-found]
-            from strands.models import BedrockModel  # type: ignore[import-not-found]
-        except Exception as exc:  # noqa: BLE001
+        if _Agent is None or _BedrockModel is None:
             msg = (
                 "Strands Agent SDK is not available; "
-                "install 'strands-agents' and related packages to continue.",
+                "install 'strands-agents' and related packages to continue."
             )
-            logger.exception(msg)
-            raise RuntimeError(msg) from exc
-
-        provider_kwargs: dict[str, Any] = {
-            "model_id": self._settings.strands_model_id,
-        }
-
-        if self._settings.bedrock_region:
-            provider_kwargs["region_name"] = self._settings.bedrock_region
-
-        inference_config: dict[str, Any] = {}
+            logger.error(msg)
+            raise RuntimeError(msg)
 
         temperature_override = (
             temperature if temperature is not None else self._settings.strands_default_temperature
         )
-        if temperature_override is not None:
-            inference_config["temperature"] = temperature_override
-
         token_limit = max_tokens if max_tokens is not None else self._settings.strands_max_tokens
-        if token_limit:
-            inference_config["maxTokens"] = token_limit
 
-        if self._settings.strands_default_top_k is not None:
-            inference_config.setdefault("topK", self._settings.strands_default_top_k)
+        cache_key = (temperature_override, token_limit)
+        model_provider = self._model_cache.get(cache_key)
+        if model_provider is None:
+            provider_kwargs: dict[str, Any] = {
+                "model_id": self._settings.strands_model_id,
+            }
 
-        if self._settings.strands_default_top_p is not None:
-            inference_config.setdefault("topP", self._settings.strands_default_top_p)
+            if self._boto_session is not None:
+                # BedrockModel rejects region_name alongside boto_session;
+                # the session already carries the region.
+                provider_kwargs["boto_session"] = self._boto_session
+                provider_kwargs["boto_client_config"] = self._boto_client_config
+            elif self._settings.bedrock_region:
+                provider_kwargs["region_name"] = self._settings.bedrock_region
 
-        if inference_config:
-            provider_kwargs["additional_request_fields"] = {
-                "inferenceConfig": inference_config,
-            }
+            inference_config: dict[str, Any] = {}
 
-        logger.debug("Creating Bedrock model provider", extra={"provider_kwargs": provider_kwargs})
+            if temperature_override is not None:
+                inference_config["temperature"] = temperature_override
 
-        try:
-            model_provider = BedrockModel(**provider_kwargs)
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("Failed to initialise Bedrock model provider")
-            raise
+            if token_limit:
+                inference_config["maxTokens"] = token_limit
+
+            if self._settings.strands_default_top_k is not None:
+                inference_config.setdefault("topK", self._settings.strands_default_top_k)
+
+            if self._settings.strands_default_top_p is not None:
+                inference_config.setdefault("topP", self._settings.strands_default_top_p)
 
-        return Agent(
+            if inference_config:
+                provider_kwargs["additional_request_fields"] = {
+                    "inferenceConfig": inference_config,
+                }
+
+            logger.debug("Creating Bedrock model provider", extra={"provider_kwargs": provider_kwargs})
+
+            try:
+                model_provider = _BedrockModel(**provider_kwargs)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("Failed to initialise Bedrock model provider")
+                raise
+            self._model_cache[cache_key] = model_provider
+
+        if not tools:
+            tools = _EMPTY_TOOLS
+        elif not isinstance(tools, list):
+            tools = list(tools)
+
+        if not isinstance(system_prompt, (str, list)):
+            system_prompt = list(system_prompt)
+
+        return _Agent(
             model=model_provider,
             system_prompt=system_prompt,
-            tools=list(tools) if tools else [],
+            tools=tools,
             callback_handler=None,
         )
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import re
-from typing import AsyncGenerator, List
+import string
+from typing import AsyncGenerator, Iterator, List, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -10,9 +12,31 @@ from ..schemas import SubjectCandidate, SubjectGenerationRequest, SubjectStreamE
 from .strands import StrandsRuntime
 
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# ASCII fast path: one C-level translate pass beats the regex VM on the short
+# labels the agent usually returns; anything non-ASCII falls back to the regex.
+_SLUG_TABLE = str.maketrans({c: "-" for c in string.punctuation + string.whitespace})
+
+_ITEM_DECODER = json.JSONDecoder()
+
+MAX_SUBJECTS = 15
+
+_SUBJECT_SYSTEM_PROMPT = (
+    "You are an official ministry of education curriculum creator. "
+    "You know the approved and appropriate subject for each grade level and design uplifting, culturally relevant learning paths. "
+    "Respond with concise subject names that can be shown in a UI list."
+)
+
+
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", value.lower()).strip("-")
-    return slug or "subject"
+    if value.isascii():
+        slug = value.lower().translate(_SLUG_TABLE)
+        while "--" in slug:
+            slug = slug.replace("--", "-")
+    else:
+        slug = _SLUG_RE.sub("-", value.lower())
+    return slug.strip("-") or "subject"
 
 
 class SubjectAgentItem(BaseModel):
@@ -28,7 +52,8 @@ class SubjectService:
     def __init__(self, runtime: StrandsRuntime) -> None:
         self._runtime = runtime
 
-    async def generate_subjects(self, payload: SubjectGenerationRequest) -> List[SubjectCandidate]:
+    @staticmethod
+    def _build_prompts(payload: SubjectGenerationRequest) -> Tuple[str, str]:
         audience = (
             "students attending school with structured classes"
             if payload.education_status == "in_school"
@@ -45,12 +70,6 @@ class SubjectService:
 
         qualifier_text = ", ".join(qualifiers) if qualifiers else "mixed ability"
 
-        system_prompt = (
-            "You are an official ministry of education curriculum creator. "
-            "You know the approved and appropriate subject for each grade level and design uplifting, culturally relevant learning paths. "
-            "Respond with concise subject names that can be shown in a UI list."
-        )
-
         prompt = f"""
 Generate a list of approved subjects for {audience} in {payload.country} who will learn in {payload.language}.
 
@@ -72,9 +91,14 @@ Guidelines:
 - In most school, mathematics is compulsory so it should be recommended
 """
 
+        return _SUBJECT_SYSTEM_PROMPT, prompt.strip()
+
+    async def generate_subjects(self, payload: SubjectGenerationRequest) -> List[SubjectCandidate]:
+        system_prompt, prompt = self._build_prompts(payload)
+
         response = await self._runtime.structured_output(
             SubjectAgentResponse,
-            prompt.strip(),
+            prompt,
             system_prompt=system_prompt,
             temperature=0.4,
         )
@@ -83,22 +107,71 @@ Guidelines:
         seen: set[str] = set()
 
         for item in response.subjects:
-            label = item.name.strip()
-            if not label:
-                continue
-            slug = _slugify(label)
-            if slug in seen:
-                continue
-            seen.add(slug)
-            items.append(
-                SubjectCandidate(
-                    id=slug,
-                    label=label,
-                    recommended=item.recommended,
-                ),
-            )
-
-        return items[:15]
+            candidate = self._to_candidate(item.name, item.recommended, seen)
+            if candidate is not None:
+                items.append(candidate)
+
+        return items[:MAX_SUBJECTS]
+
+    @staticmethod
+    def _to_candidate(name: str, recommended: bool, seen: set[str]) -> SubjectCandidate | None:
+        label = name.strip()
+        if not label:
+            return None
+        slug = _slugify(label)
+        if slug in seen:
+            return None
+        seen.add(slug)
+        return SubjectCandidate(id=slug, label=label, recommended=bool(recommended))
+
+    @staticmethod
+    def _drain_items(buffer: str, scan_pos: int) -> Tuple[Iterator[dict], int]:
+        """Decode every complete JSON object in buffer[scan_pos:].
+
+        Returns the decoded objects plus the position parsing stopped at, so
+        the caller can resume when more of the stream arrives.
+        """
+        items: list[dict] = []
+        while True:
+            brace = buffer.find("{", scan_pos)
+            if brace == -1:
+                break
+            try:
+                obj, end = _ITEM_DECODER.raw_decode(buffer, brace)
+            except ValueError:
+                # Object still arriving; retry from the same brace next chunk.
+                break
+            scan_pos = end
+            if isinstance(obj, dict):
+                items.append(obj)
+        return iter(items), scan_pos
+
+    async def _stream_subject_items(
+        self,
+        payload: SubjectGenerationRequest,
+    ) -> AsyncGenerator[dict, None]:
+        """Yield raw subject dicts as soon as each one is complete in the
+        model's streamed JSON, instead of waiting for the full response."""
+        system_prompt, prompt = self._build_prompts(payload)
+
+        buffer = ""
+        scan_pos = -1
+        async for chunk in self._runtime.stream_text(
+            prompt,
+            system_prompt=system_prompt,
+            temperature=0.4,
+        ):
+            buffer += chunk
+            if scan_pos < 0:
+                # Skip the enclosing {"subjects": [ ... ]} wrapper; item
+                # objects only start once the array is open.
+                array_start = buffer.find("[")
+                if array_start == -1:
+                    continue
+                scan_pos = array_start + 1
+            items, scan_pos = self._drain_items(buffer, scan_pos)
+            for item in items:
+                yield item
 
     async def stream_subjects(
         self,
@@ -106,8 +179,47 @@ Guidelines:
     ) -> AsyncGenerator[SubjectStreamEvent, None]:
         yield SubjectStreamEvent(type="status", message="Checking in with Graspy's learning guide…")
 
+        # Recommended subjects lead the reveal, so buffer them until the
+        # first non-recommended subject proves the recommended batch is
+        # complete; everything after that flushes as soon as it parses.
+        recommended: list[SubjectCandidate] = []
+        others_started = False
+        seen: set[str] = set()
+        emitted = 0
+
         try:
-            subjects = await self.generate_subjects(payload)
+            async for item in self._stream_subject_items(payload):
+                candidate = self._to_candidate(str(item.get("name", "")), item.get("recommended", False), seen)
+                if candidate is None:
+                    continue
+                if emitted + len(recommended) >= MAX_SUBJECTS:
+                    break
+
+                if candidate.recommended and not others_started:
+                    recommended.append(candidate)
+                    continue
+
+                if not others_started:
+                    others_started = True
+                    if recommended:
+                        yield SubjectStreamEvent(
+                            type="subjects",
+                            message="Here are the recommended starting points.",
+                            subjects=recommended,
+                        )
+                        emitted += len(recommended)
+                        recommended = []
+                        delay_ms = self._runtime.settings.subject_reveal_delay_ms
+                        if delay_ms:
+                            await asyncio.sleep(delay_ms / 1000)
+                    yield SubjectStreamEvent(
+                        type="subjects",
+                        message="More subjects you can explore.",
+                        subjects=[candidate],
+                    )
+                else:
+                    yield SubjectStreamEvent(type="subjects", subjects=[candidate])
+                emitted += 1
         except Exception as exc:  # noqa: BLE001
             yield SubjectStreamEvent(
                 type="error",
@@ -115,29 +227,20 @@ Guidelines:
             )
             return
 
-        if not subjects:
-            yield SubjectStreamEvent(
-                type="error",
-                message="The learning guide did not return any subjects.",
-            )
-            return
-
-        # Stream recommended subjects first for a playful reveal
-        recommended = [subject for subject in subjects if subject.recommended]
-        others = [subject for subject in subjects if not subject.recommended]
-
         if recommended:
+            # The model returned only recommended subjects; flush them now.
             yield SubjectStreamEvent(
                 type="subjects",
                 message="Here are the recommended starting points.",
                 subjects=recommended,
             )
-            await asyncio.sleep(0.25)
+            emitted += len(recommended)
 
-        yield SubjectStreamEvent(
-            type="subjects",
-            message="More subjects you can explore.",
-            subjects=others,
-        )
+        if not emitted:
+            yield SubjectStreamEvent(
+                type="error",
+                message="The learning guide did not return any subjects.",
+            )
+            return
 
         yield SubjectStreamEvent(type="complete", message="Subject generation complete.")
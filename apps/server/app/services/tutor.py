@@ -2,13 +2,16 @@ from __future__ import annotations
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..schemas import TutorChatRequest, TutorChatResponse
 from .strands import StrandsRuntime
 
 
 class TutorAgentPayload(BaseModel):
+    # Trim in pydantic-core at parse time so the service never re-strips.
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     answer: str = Field(..., description="Primary response for the learner.")
     follow_ups: List[str] | None = Field(
         default=None,
@@ -20,27 +23,21 @@ class TutorAgentPayload(BaseModel):
     )
 
 
+_TUTOR_SYSTEM_PROMPT = (
+    "You are Graspy, a warm and encouraging AI tutor. "
+    "You always respond in the learner's language and keep answers concise, practical, and supportive. "
+    "If you reference other topics, make the connection explicit."
+)
+
+
 class TutorService:
     def __init__(self, runtime: StrandsRuntime) -> None:
         self._runtime = runtime
 
     async def chat(self, payload: TutorChatRequest) -> TutorChatResponse:
-        history_lines = []
-        for entry in (payload.history or [])[-8:]:
-            speaker = "Graspy" if entry.role == "assistant" else "Learner"
-            history_lines.append(f"{speaker}: {entry.content.strip()}")
-        history_text = "\n".join(history_lines) or "None"
-
-        related_topics = ", ".join(payload.related_topics or []) or "None"
         grade_level = payload.grade_level or "middle school"
         country = payload.country or "unspecified"
 
-        system_prompt = (
-            "You are Graspy, a warm and encouraging AI tutor. "
-            "You always respond in the learner's language and keep answers concise, practical, and supportive. "
-            "If you reference other topics, make the connection explicit."
-        )
-
         instruction = f"""
 Learner profile:
 - Country: {country}
@@ -48,10 +45,10 @@ Learner profile:
 - Grade Level: {grade_level}
 - Subject: {payload.subject}
 - Current topic: {payload.topic or "Not specified"}
-- Related topics to consider: {related_topics}
+- Related topics to consider: {payload.related_topics_text}
 
 Recent conversation:
-{history_text}
+{payload.history_text}
 
 Current learner message:
 \"\"\"{payload.message}\"\"\"
@@ -67,20 +64,14 @@ Guidelines:
         result = await self._runtime.structured_output(
             TutorAgentPayload,
             instruction.strip(),
-            system_prompt=system_prompt,
+            system_prompt=_TUTOR_SYSTEM_PROMPT,
             temperature=0.5,
         )
 
-        followups = result.follow_ups or None
-        if followups:
-            followups = [item.strip() for item in followups if item.strip()]
-            if not followups:
-                followups = None
-
-        navigation_tip = result.navigation_tip.strip() if result.navigation_tip else None
+        followups = [item for item in result.follow_ups or [] if item] or None
 
         return TutorChatResponse(
-            answer=result.answer.strip(),
+            answer=result.answer,
             follow_ups=followups,
-            navigation_tip=navigation_tip,
+            navigation_tip=result.navigation_tip or None,
         )
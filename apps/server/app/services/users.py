@@ -1,80 +1,247 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+import itertools
 import json
-from datetime import datetime
+import os
+import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from fastapi import HTTPException, status
-from fastapi.concurrency import run_in_threadpool
 
 from ..schemas import User, UserCreate, UserUpdate
 from ..settings import Settings
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - wheel not always available
+    orjson = None
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dump_line(record: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+
+
+# Compact the journal back into the snapshot once it outgrows this size.
+_JOURNAL_COMPACT_BYTES = 64 * 1024
+
+
+def _index_users(users: List[Dict[str, Any]]) -> Dict[int, int]:
+    """Map user id to list position for O(1) update/delete lookups."""
+    return {user["id"]: position for position, user in enumerate(users)}
+
 
 class UserService:
+    # Disambiguates ids created within the same millisecond.
+    _id_counter = itertools.count()
+    # Highest id handed out so far; guards uniqueness if a burst exceeds
+    # the counter's 10 bits within one millisecond.
+    _last_id = 0
+
     def __init__(self, settings: Settings) -> None:
         self._path: Path = settings.user_db_path
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        # Mutations append one-line records here instead of rewriting the
+        # whole snapshot; reads replay the journal over the snapshot.
+        self._journal_path: Path = self._path.with_suffix(".jsonl")
+        # Parsed store cached against the stat signature of snapshot plus
+        # journal so unchanged files skip the disk read and JSON parse; deep
+        # copies guard the cached tree from caller mutation.
+        self._cache: tuple[tuple[int, ...], Dict[str, Any]] | None = None
+        # Serializes read-modify-write cycles so concurrent mutations cannot
+        # interleave; readers stay lock-free thanks to the cache.
+        self._write_lock = asyncio.Lock()
+        # Mutations queued in the same event-loop tick are applied and
+        # journaled together by one flush task, so a burst pays for a single
+        # write instead of one per call.
+        self._pending: list[tuple[Callable[[Dict[str, Any], Dict[int, int]], Dict[str, Any]], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
         if not self._path.exists():
             self._initialize_store()
 
     async def list_users(self) -> List[User]:
-        data = await self._read_db()
+        # The store is small and usually served from the stat-keyed cache, so
+        # reading inline is cheaper than a threadpool handoff.
+        data = self._read_db_sync()
         return [User(**item) for item in data.get("users", [])]
 
     async def add_user(self, payload: UserCreate) -> None:
-        data = await self._read_db()
-        users = data.setdefault("users", [])
         user = self._create_user(payload)
-        users.append(user)
-        await self._write_db(data)
+
+        def mutate(data: Dict[str, Any], index: Dict[int, int]) -> Dict[str, Any]:
+            users = data.setdefault("users", [])
+            index[user["id"]] = len(users)
+            users.append(user)
+            return {"op": "add", "user": user}
+
+        await self._enqueue_mutation(mutate)
 
     async def update_user(self, payload: UserUpdate) -> None:
-        data = await self._read_db()
-        users = data.get("users", [])
-        for index, existing in enumerate(users):
-            if existing["id"] == payload.id:
-                users[index] = {
-                    **existing,
-                    "name": payload.name,
-                    "email": payload.email,
-                }
-                await self._write_db(data)
-                return
-
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+        def mutate(data: Dict[str, Any], index: Dict[int, int]) -> Dict[str, Any]:
+            position = index.get(payload.id)
+            if position is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found",
+                )
+            users = data["users"]
+            updated = {
+                **users[position],
+                "name": payload.name,
+                "email": payload.email,
+            }
+            users[position] = updated
+            return {"op": "update", "user": updated}
+
+        await self._enqueue_mutation(mutate)
 
     async def delete_user(self, user_id: int) -> None:
-        data = await self._read_db()
-        users = data.get("users", [])
-        for index, existing in enumerate(users):
-            if existing["id"] == user_id:
-                users.pop(index)
-                await self._write_db(data)
-                return
-
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found",
-        )
+        def mutate(data: Dict[str, Any], index: Dict[int, int]) -> Dict[str, Any]:
+            position = index.pop(user_id, None)
+            if position is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="User not found",
+                )
+            data["users"].pop(position)
+            for uid, other in index.items():
+                if other > position:
+                    index[uid] = other - 1
+            return {"op": "delete", "id": user_id}
+
+        await self._enqueue_mutation(mutate)
 
-    async def _read_db(self) -> Dict[str, Any]:
-        return await run_in_threadpool(self._read_db_sync)
+    async def _enqueue_mutation(self, mutate: Callable[[Dict[str, Any], Dict[int, int]], Dict[str, Any]]) -> None:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((mutate, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+        await future
 
-    async def _write_db(self, data: Dict[str, Any]) -> None:
-        await run_in_threadpool(self._write_db_sync, data)
+    async def _flush_pending(self) -> None:
+        while self._pending:
+            # Yield once so callers queued in the same tick join this batch.
+            await asyncio.sleep(0)
+            async with self._write_lock:
+                pending, self._pending = self._pending, []
+                try:
+                    data = self._read_db_sync()
+                    index = _index_users(data.setdefault("users", []))
+                except Exception as exc:  # noqa: BLE001 - delivered to the callers
+                    # A corrupt or missing store must fail the queued
+                    # mutations, not strand their futures unresolved.
+                    for _, future in pending:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+                records: list[Dict[str, Any]] = []
+                flushed: list[asyncio.Future] = []
+                for mutate, future in pending:
+                    if future.done():
+                        continue
+                    try:
+                        records.append(mutate(data, index))
+                    except Exception as exc:  # noqa: BLE001 - delivered to the caller
+                        future.set_exception(exc)
+                    else:
+                        flushed.append(future)
+                if records:
+                    try:
+                        self._apply_mutations_sync(records, data)
+                    except Exception as exc:  # noqa: BLE001 - delivered to the callers
+                        for future in flushed:
+                            future.set_exception(exc)
+                        continue
+                for future in flushed:
+                    future.set_result(None)
+
+    def _stat_key(self) -> tuple[int, ...]:
+        stat = self._path.stat()
+        try:
+            journal_stat = self._journal_path.stat()
+        except FileNotFoundError:
+            return (stat.st_mtime_ns, stat.st_size, 0, 0)
+        return (stat.st_mtime_ns, stat.st_size, journal_stat.st_mtime_ns, journal_stat.st_size)
 
     def _read_db_sync(self) -> Dict[str, Any]:
-        with self._path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        key = self._stat_key()
+        cache = self._cache
+        if cache is not None and cache[0] == key:
+            return copy.deepcopy(cache[1])
+        data = _loads(self._path.read_bytes())
+        self._replay_journal_sync(data)
+        self._cache = (key, copy.deepcopy(data))
+        return data
+
+    def _replay_journal_sync(self, data: Dict[str, Any]) -> None:
+        try:
+            raw = self._journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        users = data.setdefault("users", [])
+        index = _index_users(users)
+        for line in raw.splitlines():
+            if not line:
+                continue
+            record = _loads(line)
+            op = record.get("op")
+            if op == "add":
+                user = record["user"]
+                # Idempotent replay: a crash between compaction's snapshot
+                # write and the journal unlink leaves already-folded adds in
+                # the journal; skipping known ids keeps them from duplicating.
+                if user["id"] in index:
+                    continue
+                index[user["id"]] = len(users)
+                users.append(user)
+            elif op == "update":
+                user = record["user"]
+                position = index.get(user["id"])
+                if position is not None:
+                    users[position] = user
+            elif op == "delete":
+                position = index.pop(record["id"], None)
+                if position is not None:
+                    users.pop(position)
+                    for uid, other in index.items():
+                        if other > position:
+                            index[uid] = other - 1
+
+    def _apply_mutations_sync(self, records: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+        with self._journal_path.open("ab") as handle:
+            handle.write(b"".join(_dump_line(record) for record in records))
+        if self._journal_path.stat().st_size > _JOURNAL_COMPACT_BYTES:
+            # Fold the journal into the snapshot and start a fresh journal.
+            self._write_snapshot_sync(data)
+            self._journal_path.unlink()
+        self._cache = (self._stat_key(), copy.deepcopy(data))
+
+    def _write_snapshot_sync(self, data: Dict[str, Any]) -> None:
+        # Write-then-rename so a crash mid-dump can never leave a truncated
+        # snapshot behind; os.replace is atomic on POSIX and Windows.
+        tmp = self._path.with_suffix(self._path.suffix + ".tmp")
+        tmp.write_bytes(_dumps(data))
+        os.replace(tmp, self._path)
 
     def _write_db_sync(self, data: Dict[str, Any]) -> None:
-        with self._path.open("w", encoding="utf-8") as handle:
-            json.dump(data, handle, indent=2, ensure_ascii=True)
+        self._write_snapshot_sync(data)
+        self._cache = (self._stat_key(), copy.deepcopy(data))
 
     def _initialize_store(self) -> None:
         sample = {
@@ -102,14 +269,31 @@ class UserService:
         self._write_db_sync(sample)
 
     def _create_user(self, payload: UserCreate) -> Dict[str, Any]:
-        now = datetime.utcnow().isoformat() + "Z"
+        # One clock read feeds both the id and the created timestamp;
+        # formatting via gmtime skips the datetime object and the float
+        # round-trip while keeping the same millisecond-capable shape.
+        ts_ns = time.time_ns()
+        sec, nsec = divmod(ts_ns, 1_000_000_000)
+        created = (
+            f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(sec))}"
+            f".{nsec // 1000:06d}Z"
+        )
+        # name/email are already normalized by the schema validators.
         return {
-            "id": self._generate_id(),
-            "name": payload.name.strip(),
-            "email": payload.email.strip().lower(),
-            "created": now,
+            "id": self._generate_id(ts_ns),
+            "name": payload.name,
+            "email": payload.email,
+            "created": created,
         }
 
-    @staticmethod
-    def _generate_id() -> int:
-        return int(datetime.utcnow().timestamp() * 1_000_000)
+    @classmethod
+    def _generate_id(cls, ts_ns: int) -> int:
+        # Millisecond timestamp in the high bits keeps ids roughly ordered;
+        # the low 10 bits disambiguate ids minted in the same millisecond.
+        # Staying near 2^51 keeps ids under JavaScript's 2^53 safe-integer
+        # limit, since the frontend round-trips them through JSON numbers.
+        candidate = (ts_ns // 1_000_000 << 10) | (next(cls._id_counter) & 0x3FF)
+        if candidate <= cls._last_id:
+            candidate = cls._last_id + 1
+        cls._last_id = candidate
+        return candidate
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Environment/filesystem side effects only need to happen once per process,
+# not per Settings() construction.
+_env_setup_done = False
+
 
 class Settings(BaseSettings):
     """
@@ -28,6 +34,7 @@ class Settings(BaseSettings):
     host: str = Field(default="0.0.0.0", description="Server host binding")
     port: int = Field(default=8081, gt=0, lt=65536, description="Server port number")
     uvicorn_reload: bool = Field(default=False, description="Enable auto-reload in development")
+    workers: int = Field(default=1, gt=0, description="Number of uvicorn worker processes")
     cors_origins: Optional[List[str]] = Field(default=None, description="List of allowed CORS origins")
 
     # ============================================================
@@ -73,12 +80,26 @@ class Settings(BaseSettings):
     strands_default_temperature: float = Field(default=0.0, ge=0.0, le=2.0, description="Temperature")
     strands_default_top_k: int = Field(default=1, gt=0, description="Top-K sampling")
     strands_default_top_p: Optional[float] = Field(default=None, ge=0.0, le=1.0, description="Top-P sampling")
+    bedrock_call_timeout_s: float = Field(default=60.0, gt=0, description="Per-call Bedrock timeout in seconds")
 
     # ============================================================
     # Lesson Generation Configuration
     # ============================================================
     lesson_slide_max_tokens: Optional[int] = Field(default=None, gt=0)
     lesson_practice_max_tokens: Optional[int] = Field(default=None, gt=0)
+    lesson_use_orchestrator: bool = Field(
+        default=False,
+        description="Also race the Lesson Director orchestrator agent against the direct path (debugging aid)",
+    )
+
+    # ============================================================
+    # Subject Generation Configuration
+    # ============================================================
+    subject_reveal_delay_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Cosmetic pause between the recommended and remaining subject batches",
+    )
 
     # ============================================================
     # API Keys
@@ -93,7 +114,6 @@ class Settings(BaseSettings):
             return None
         if isinstance(v, str):
             # Try JSON first
-            import json
             if v.strip().startswith("["):
                 try:
                     parsed = json.loads(v)
@@ -121,6 +141,15 @@ class Settings(BaseSettings):
         2. Set AWS environment variables for boto3 compatibility
         3. Resolve fallback values
         """
+        # Resolve model ID fallback
+        if not self.strands_model_id and self.bedrock_model_id:
+            self.strands_model_id = self.bedrock_model_id
+
+        global _env_setup_done
+        if _env_setup_done:
+            return self
+        _env_setup_done = True
+
         # Create data directory
         if self.py_server_data_dir:
             self.py_server_data_dir.mkdir(parents=True, exist_ok=True)
@@ -146,10 +175,6 @@ class Settings(BaseSettings):
         if session_token:
             os.environ.setdefault("AWS_SESSION_TOKEN", session_token)
 
-        # Resolve model ID fallback
-        if not self.strands_model_id and self.bedrock_model_id:
-            self.strands_model_id = self.bedrock_model_id
-
         return self
 
     # ============================================================
@@ -193,9 +218,12 @@ class Settings(BaseSettings):
         return self.bedrock_aws_session_token or self.aws_session_token
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
-    Factory function to get Settings instance.
-    Uses Pydantic's caching mechanism for singleton-like behavior.
+    Return the process-wide Settings instance.
+
+    Constructing Settings re-reads .env and re-runs every validator, so the
+    instance is built once and cached for all later callers.
     """
     return Settings()
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import copy
+import functools
+import json
 import logging
+import re
 from typing import Any, AsyncGenerator, Optional, Type, Union, cast
 
 from pydantic import BaseModel
@@ -15,6 +19,47 @@ if not logger.handlers:
     logger.addHandler(logging.NullHandler())
 
 
+# Models sometimes wrap the structured JSON in markdown fences instead of
+# issuing a tool call; stripping them is a microsecond repair that saves a
+# full regeneration round-trip.
+_CODE_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*\n?(.*?)\n?```\s*$", re.DOTALL)
+
+# Reasoning-mode models prepend <think>...</think> blocks that are never part
+# of the payload.
+_THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL | re.IGNORECASE)
+
+
+def _preclean_llm_json(text: str) -> str:
+    """Strip reasoning preambles and markdown fences from a raw completion
+    so the remainder can be parsed as JSON."""
+    text = _THINK_RE.sub("", text).strip()
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1) if match else text
+
+
+def _salvage_output_from_text(messages: dict[str, Any]) -> Optional[dict[str, Any]]:
+    """Recover the structured payload from plain text blocks when the model
+    answered with JSON instead of the forced tool call."""
+    for block in messages["content"]:
+        text = block.get("text")
+        if not text:
+            continue
+        try:
+            candidate = json.loads(_preclean_llm_json(text))
+        except ValueError:
+            continue
+        if isinstance(candidate, dict):
+            return candidate
+    return None
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_tool_spec(output_model: Type[BaseModel]) -> dict[str, Any]:
+    """Derive the tool spec once per model class; the schema walk is
+    deterministic and far from free."""
+    return convert_pydantic_to_tool_spec(output_model)
+
+
 def _coerce_tool_choice(tool_choice: Optional[ToolChoice], tool_name: str) -> ToolChoice:
     if tool_choice and "tool" in tool_choice:
         return tool_choice
@@ -30,7 +75,8 @@ async def _structured_output_with_explicit_tool_choice(
     tool_choice: Optional[ToolChoice] = None,
     **kwargs: Any,
 ) -> AsyncGenerator[dict[str, Union[BaseModel, Any]], None]:
-    tool_spec = convert_pydantic_to_tool_spec(output_model)
+    # Deep-copy the cached spec in case strands mutates it downstream.
+    tool_spec = copy.deepcopy(_cached_tool_spec(output_model))
     effective_tool_choice = _coerce_tool_choice(tool_choice, tool_spec["name"])
 
     response = self.stream(
@@ -41,10 +87,16 @@ async def _structured_output_with_explicit_tool_choice(
         **kwargs,
     )
 
+    final_event: Optional[dict[str, Any]] = None
     async for event in streaming.process_stream(response):
+        if "stop" in event:
+            final_event = event
         yield event
 
-    stop_reason, messages, _, _ = event["stop"]
+    if final_event is None:
+        raise ValueError("Bedrock stream ended without a stop event.")
+
+    stop_reason, messages, _, _ = final_event["stop"]
     if stop_reason not in {"tool_use", "end_turn"}:
         raise ValueError(f'Model returned stop_reason: {stop_reason} instead of "tool_use".')
 
@@ -56,6 +108,9 @@ async def _structured_output_with_explicit_tool_choice(
             output_response = payload.get("input")
             break
 
+    if output_response is None:
+        output_response = _salvage_output_from_text(messages)
+
     if output_response is None:
         raise ValueError("No valid tool use or tool use input was found in the Bedrock response.")
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import Dict, List
 
 from ..schemas import CurriculumRequest, CurriculumSubject, CurriculumSubjects, CurriculumTopics
 from ..services.strands import StrandsRuntime
 
+# Cap on concurrent per-subject Bedrock calls when building a topic map.
+_TOPIC_CONCURRENCY = 5
+
 CURRICULUM_PLANNER_SP = (
     "You are a curriculum planner with knowledge of all approved subjects by a particular country available to a grade level to take"
     "The subject mentioned must match the age or grade level."
@@ -14,20 +18,28 @@ CURRICULUM_PLANNER_SP = (
 )
 
 
-def _sanitize_sequence(values: List[str], *, limit: int) -> List[str]:
+def _sanitize_sequence(values: List[str], *, limit: int, dedup: bool = True) -> List[str]:
     cleaned: List[str] = []
+    seen: set[str] = set()
     for item in values:
         candidate = item.strip()
         if not candidate:
             continue
+        key = candidate.casefold()
+        if dedup and key in seen:
+            continue
+        seen.add(key)
         cleaned.append(candidate)
         if len(cleaned) >= limit:
             break
     return cleaned
 
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+
 def _slugify(value: str) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "-", value.lower()).strip("-")
+    slug = _SLUG_RE.sub("-", value.lower()).strip("-")
     return slug or "subject"
 
 
@@ -46,20 +58,34 @@ def _normalize_subjects(entries: List[str]) -> List[CurriculumSubject]:
     return normalized
 
 
+_GRADE_LABELS = {
+    "beginner": "early primary learners (ages 6-8)",
+    "elementary": "upper primary learners (ages 9-11)",
+    "middle": "middle school learners (ages 12-14)",
+    "high": "secondary school learners (ages 15-17)",
+}
+
+# The variable parts of the per-subject topic prompt are tiny, so build the
+# prompt with one format call over a constant template instead of re-joining
+# the whole string literal per subject.
+_TOPIC_PROMPT_TEMPLATE = (
+    "Create a progressive list of teachable topics for the subject.\n"
+    "Subject: {name}\n"
+    "Country: {country}\n"
+    "Language of instruction: {language}\n"
+    "Grade level: {grade_label}\n\n"
+    "Rules:\n"
+    "- Return 5 to 7 topics ordered from foundational to more advanced\n"
+    "- Keep titles short and student-friendly\n"
+    "- Avoid duplicates and overly granular sub-points\n"
+    "- Respond strictly with the schema's 'topics' array"
+)
+
+
 def _describe_grade_level(level: str | None) -> str:
     if not level:
         return "middle school learners"
-
-    value = level.strip().lower()
-    if value == "beginner":
-        return "early primary learners (ages 6-8)"
-    if value == "elementary":
-        return "upper primary learners (ages 9-11)"
-    if value == "middle":
-        return "middle school learners (ages 12-14)"
-    if value == "high":
-        return "secondary school learners (ages 15-17)"
-    return level
+    return _GRADE_LABELS.get(level.strip().lower(), level)
 
 
 async def generate_curriculum_plan(
@@ -110,30 +136,45 @@ async def generate_subject_list(
     cleaned = _sanitize_sequence(result.subjects, limit=12)
     return _normalize_subjects(cleaned)
 
+async def generate_subject_topics(
+    runtime: StrandsRuntime,
+    request: CurriculumRequest,
+    subject: CurriculumSubject,
+) -> List[str]:
+    grade_label = _describe_grade_level(request.grade_level)
+
+    result = await runtime.structured_output(
+        CurriculumTopics,
+        _TOPIC_PROMPT_TEMPLATE.format(
+            name=subject.name,
+            country=request.country,
+            language=request.language,
+            grade_label=grade_label,
+        ),
+        system_prompt=CURRICULUM_PLANNER_SP,
+    )
+    return _sanitize_sequence(result.topics, limit=7)
+
+
 async def generate_topic_map(
     runtime: StrandsRuntime,
     request: CurriculumRequest,
     subjects: List[CurriculumSubject],
 ) -> Dict[str, List[str]]:
-    grade_label = _describe_grade_level(request.grade_level)
-
-    topics: Dict[str, List[str]] = {}
-    for subject in subjects:
-        result = await runtime.structured_output(
-            CurriculumTopics,
-            (
-                "Create a progressive list of teachable topics for the subject.\n"
-                f"Subject: {subject.name}\n"
-                f"Country: {request.country}\n"
-                f"Language of instruction: {request.language}\n"
-                f"Grade level: {grade_label}\n\n"
-                "Rules:\n"
-                "- Return 5 to 7 topics ordered from foundational to more advanced\n"
-                "- Keep titles short and student-friendly\n"
-                "- Avoid duplicates and overly granular sub-points\n"
-                "- Respond strictly with the schema's 'topics' array"
-            ),
-            system_prompt=CURRICULUM_PLANNER_SP,
-        )
-        topics[subject.slug] = _sanitize_sequence(result.topics, limit=7)
-    return topics
+    # Caller-supplied topics (edited plans, replays) skip Bedrock entirely,
+    # mirroring the subjects short-circuit in generate_subject_list.
+    if request.topics:
+        return {
+            subject.slug: _sanitize_sequence(request.topics.get(subject.name, []), limit=7)
+            for subject in subjects
+        }
+
+    # Subject topic lists are independent, so fan the Bedrock calls out
+    # concurrently, bounded to stay inside rate limits.
+    semaphore = asyncio.Semaphore(_TOPIC_CONCURRENCY)
+
+    async def one(subject: CurriculumSubject) -> tuple[str, List[str]]:
+        async with semaphore:
+            return subject.slug, await generate_subject_topics(runtime, request, subject)
+
+    return dict(await asyncio.gather(*(one(subject) for subject in subjects)))
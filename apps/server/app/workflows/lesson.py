@@ -1,29 +1,47 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Dict, List, Optional
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 
+from pydantic import BaseModel
 from strands import Agent, tool  # type: ignore[import-not-found]
 
 from ..schemas import (
     LessonAgentResponse,
+    LessonPractice,
     LessonPracticePayload,
     LessonRequest,
     LessonSlide,
+    LessonSlideAssessment,
     LessonSlidesPayload,
 )
-from ..services.strands import StrandsRuntime
+from ..services.strands import StrandsRuntime, cached_system_prompt
 
 logger = logging.getLogger(__name__)
 
 
-_CONTROL_CHAR_LATEX_ESCAPES = {
-    ord("\t"): "\\t",
-    ord("\b"): "\\b",
-    ord("\f"): "\\f",
-    ord("\r"): "\\r",
-}
+@dataclass(slots=True, frozen=True)
+class LessonAssets:
+    """Sanitized lesson content handed from the workflow to LessonService."""
+
+    overview: str
+    learning_objectives: List[str]
+    slides: List[LessonSlide]
+
+
+# Compiled translation table (C-level lookup during str.translate).
+_CONTROL_CHAR_LATEX_ESCAPES = str.maketrans({
+    "\t": "\\t",
+    "\b": "\\b",
+    "\f": "\\f",
+    "\r": "\\r",
+})
 
 
 def _normalize_text(value: str) -> str:
@@ -39,8 +57,11 @@ def _normalize_text(value: str) -> str:
     # First, strip whitespace
     normalized = value.strip()
 
-    # Restore any control characters that should be LaTeX escapes
-    normalized = normalized.translate(_CONTROL_CHAR_LATEX_ESCAPES)
+    # Restore any control characters that should be LaTeX escapes. Most
+    # strings contain none of them, so four C-level scans gate the
+    # table-translate pass.
+    if "\t" in normalized or "\b" in normalized or "\f" in normalized or "\r" in normalized:
+        normalized = normalized.translate(_CONTROL_CHAR_LATEX_ESCAPES)
 
     # The text should already have proper delimiters from the LLM
     # Just return it - the frontend will handle the rendering
@@ -51,44 +72,69 @@ def _normalize_text(value: str) -> str:
 
 
 def _sanitize_slide_payload(slides: LessonSlidesPayload) -> LessonSlidesPayload:
+    # Cheap shape guards first: malformed output fails before any
+    # per-field normalization is paid for, which matters when retries are
+    # frequent.
+    if len(slides.slides) < 5:
+        raise ValueError("Slide generation did not return exactly five slides")
+    if len(slides.learning_objectives) < 3:
+        raise ValueError("Slide generation must return exactly three learning objectives")
+
     overview = _normalize_text(slides.overview)
-    objectives = [_normalize_text(item) for item in slides.learning_objectives if item.strip()][:3]
+    # The walrus filters on the normalized value, saving the extra strip the
+    # old `if item.strip()` guard paid per element.
+    objectives = [text for item in slides.learning_objectives if (text := _normalize_text(item))][:3]
 
     sanitized_slides: List[LessonSlide] = []
     for raw_slide in slides.slides[:5]:
-        slide_data = raw_slide.model_dump()
-        slide_data["title"] = _normalize_text(raw_slide.title)
-
-        # Log the before/after for debugging LaTeX issues
+        # Log the before/after for debugging LaTeX issues; lazy %-formatting
+        # keeps the slicing and formatting out of the non-debug path.
         original_body = raw_slide.body_md
         normalized_body = _normalize_text(original_body)
-        if "\\" in original_body or "\\" in normalized_body:
-            logger.debug(f"Slide body normalization:\nOriginal: {original_body[:200]}\nNormalized: {normalized_body[:200]}")
-        slide_data["body_md"] = normalized_body
+        if logger.isEnabledFor(logging.DEBUG) and ("\\" in original_body or "\\" in normalized_body):
+            logger.debug(
+                "Slide body normalization:\nOriginal: %s\nNormalized: %s",
+                original_body[:200],
+                normalized_body[:200],
+            )
 
         assessment = raw_slide.assessment
         if not assessment:
             raise ValueError("Slide generation returned a slide without an assessment")
+        if len(assessment.options) < 3:
+            raise ValueError("Slide assessment must include exactly three options")
 
-        assessment_data = assessment.model_dump()
-        assessment_data["prompt"] = _normalize_text(assessment.prompt)
-        options = [_normalize_text(option) for option in assessment.options if option.strip()]
+        options = [text for option in assessment.options if (text := _normalize_text(option))]
         if len(options) != 3:
             raise ValueError("Slide assessment must include exactly three options")
-        assessment_data["options"] = options
-        assessment_data["correct_feedback"] = _normalize_text(assessment.correct_feedback)
-        assessment_data["incorrect_feedback"] = _normalize_text(assessment.incorrect_feedback)
 
-        assessment_index = assessment_data.get("answer_index")
+        answer_index = assessment.answer_index
         max_index = len(options) - 1
-        if isinstance(assessment_index, int):
-            assessment_data["answer_index"] = max(0, min(max_index, assessment_index))
+        if isinstance(answer_index, int):
+            answer_index = max(0, min(max_index, answer_index))
         else:
-            assessment_data["answer_index"] = 0
-
-        slide_data["assessment"] = assessment_data
-
-        sanitized_slides.append(LessonSlide.model_validate(slide_data))
+            answer_index = 0
+
+        # model_copy(update=...) swaps in the normalized strings without the
+        # dump/validate round-trip; the source fields are already typed.
+        sanitized_assessment = assessment.model_copy(
+            update={
+                "prompt": _normalize_text(assessment.prompt),
+                "options": options,
+                "answer_index": answer_index,
+                "correct_feedback": _normalize_text(assessment.correct_feedback),
+                "incorrect_feedback": _normalize_text(assessment.incorrect_feedback),
+            }
+        )
+        sanitized_slides.append(
+            raw_slide.model_copy(
+                update={
+                    "title": _normalize_text(raw_slide.title),
+                    "body_md": normalized_body,
+                    "assessment": sanitized_assessment,
+                }
+            )
+        )
 
     if len(objectives) != 3:
         raise ValueError("Slide generation must return exactly three learning objectives")
@@ -98,12 +144,10 @@ def _sanitize_slide_payload(slides: LessonSlidesPayload) -> LessonSlidesPayload:
     if len(sanitized_slides) != 5:
         raise ValueError("Slide generation did not return exactly five slides")
 
-    return LessonSlidesPayload.model_validate(
-        {
-            "overview": overview,
-            "learningObjectives": objectives,
-            "slides": [slide.model_dump(by_alias=True) for slide in sanitized_slides],
-        }
+    return LessonSlidesPayload.model_construct(
+        overview=overview,
+        learning_objectives=objectives,
+        slides=sanitized_slides,
     )
 
 
@@ -113,19 +157,18 @@ def _sanitize_practice_payload(practice: LessonPracticePayload) -> LessonPractic
     if not practice.question.strip():
         raise ValueError("Practice generation returned empty question")
 
-    practice_options = [_normalize_text(option) for option in practice.options if option.strip()]
+    practice_options = [text for option in practice.options if (text := _normalize_text(option))]
     if len(practice_options) != 3:
         raise ValueError("Practice generation must include exactly three options")
 
-    sanitized_practice = {
-        "question": _normalize_text(practice.question),
-        "options": practice_options,
-        "correct_option_index": practice.correct_option_index,
-        "correct_feedback": _normalize_text(practice.correct_feedback),
-        "incorrect_feedback": _normalize_text(practice.incorrect_feedback),
-    }
-
-    return LessonPracticePayload.model_validate(sanitized_practice)
+    return practice.model_copy(
+        update={
+            "question": _normalize_text(practice.question),
+            "options": practice_options,
+            "correct_feedback": _normalize_text(practice.correct_feedback),
+            "incorrect_feedback": _normalize_text(practice.incorrect_feedback),
+        }
+    )
 
 
 LESSON_SYSTEM_PROMPT = (
@@ -154,42 +197,116 @@ Tool usage rules:
 - If a tool call fails, report the error in your final JSON under an "error" key instead.
 """.strip()
 
+# cachePoint-wrapped forms: every lesson call reuses these verbatim, so the
+# provider can serve the prefilled system prompt as a cache read.
+_LESSON_SYSTEM_BLOCKS = cached_system_prompt(LESSON_SYSTEM_PROMPT)
+_PRACTICE_SYSTEM_BLOCKS = cached_system_prompt(PRACTICE_SYSTEM_PROMPT)
+_ORCHESTRATOR_SYSTEM_BLOCKS = cached_system_prompt(ORCHESTRATOR_SYSTEM_PROMPT)
+
+
+# Static instruction tier of the slide prompt. Kept first and byte-stable so
+# it forms a provider-cacheable prefix across every learner and topic; only
+# the short per-request tail below it varies.
+_SLIDE_STATIC_INSTRUCTIONS = (
+    "Create exactly five lesson slides for the subject and topic given below.\n"
+    "Instructional requirements:\n"
+    "1. Begin each slide body by recalling the previous idea or explaining why this slide matters next.\n"
+    "2. Worked examples must show annotated reasoning steps; typeset mathematics with LaTeX using $ ... $ for inline math or $$ ... $$ for display math when appropriate.\n"
+    "3. Scaffolded problems must contain three mini tasks of increasing complexity within the body text.\n"
+    "4. Misconception slides must quote the misconception, debunk it, and provide an everyday-life example.\n"
+    "5. Synthesis slides must connect back to at least one previous slide, preview the next topic, "
+    "and use a choice assessment with correctFeedback and incorrectFeedback.\n"
+    "Checkpoint rules:\n"
+    "- Every assessment prompt must reference details from the slide body.\n"
+    "- Choice checkpoints must provide exactly three options labelled in plain text and set the correct answerIndex.\n"
+    '- Mention the "tutor" or "chat" to encourage the learner to share their response.\n'
+    "The overview must contain 3-4 sentences, and learning objectives should be three concise, action-oriented statements. "
+    "Respond concisely so the tool output fits within the schema."
+)
 
-def _build_slide_prompt(request: LessonRequest, grade: str, *, compact: bool = False) -> str:
-    body_range = "160-210" if not compact else "110-150"
-    planning_sentence = (
-        "Before writing, silently plan the learning arc so each slide builds on the previous one."
-        if not compact
-        else (
-            "Before writing, take a brief moment to plan the learning arc. Keep responses concise to avoid running out of tokens."
-        )
-    )
-    compact_guidance = (
-        ""
-        if not compact
-        else "Trim optional anecdotes and keep wording tight so the full JSON fits within the token limit."
+_CACHE_POINT = {"cachePoint": {"type": "default"}}
+
+# Per-request tails as import-time templates: one format call per build, and
+# byte-identical static text across calls.
+_SLIDE_VOLATILE_TEMPLATE = (
+    "Subject: {subject}\n"
+    "Topic: {topic}\n"
+    "Learner country: {country}. Learner language: {language}. Grade level: {grade}.\n"
+    "{planning_sentence}\n"
+    "Each slide body should contain approximately {body_range} words using paragraphs and, when helpful, bullet or numbered lists."
+)
+
+# Bundle variant: slides plus the MCQ in one structured response, so a
+# lesson costs one round-trip and the model reuses its own slide context
+# for the practice question instead of re-ingesting summaries.
+_BUNDLE_STATIC_INSTRUCTIONS = (
+    "Respond with a JSON object containing two keys: \"slides\" and \"practice\".\n"
+    "For \"slides\":\n"
+    + _SLIDE_STATIC_INSTRUCTIONS
+    + "\nFor \"practice\": after the slides, write one formative assessment MCQ based strictly on the slides you just produced — "
+    "three concise options, the index of the correct option, and specific feedback for correct and incorrect answers, all in the learner's language."
+)
+
+_SLIDE_PLANNING_NORMAL = "Before writing, silently plan the learning arc so each slide builds on the previous one."
+
+# The compact retry is expressed entirely as this trailing block — the
+# static instructions AND the volatile tail stay byte-identical to the
+# first attempt, so the provider serves the whole shared prefix from cache
+# on the retry.
+_SLIDE_COMPACT_SUFFIX = (
+    "Token budget is tight: target 110-150 words per slide body instead, trim optional anecdotes, "
+    "and keep wording tight so the full JSON fits within the token limit."
+)
+
+
+def _build_slide_prompt(request: LessonRequest, grade: str, *, compact: bool = False) -> list[dict]:
+    volatile = _SLIDE_VOLATILE_TEMPLATE.format(
+        subject=request.subject,
+        topic=request.topic,
+        country=request.country,
+        language=request.language,
+        grade=grade,
+        planning_sentence=_SLIDE_PLANNING_NORMAL,
+        body_range="160-210",
     )
 
-    return (
-        f"Create exactly five lesson slides for {request.subject} on the topic {request.topic}.\n"
-        f"Learner country: {request.country}. Learner language: {request.language}. Grade level: {grade}.\n"
-        f"{planning_sentence}"
-        "Instructional requirements:\n"
-        "1. Begin each slide body by recalling the previous idea or explaining why this slide matters next.\n"
-        "2. Worked examples must show annotated reasoning steps; typeset mathematics with LaTeX using $ ... $ for inline math or $$ ... $$ for display math when appropriate.\n"
-        "3. Scaffolded problems must contain three mini tasks of increasing complexity within the body text.\n"
-        "4. Misconception slides must quote the misconception, debunk it, and provide an everyday-life example.\n"
-        "5. Synthesis slides must connect back to at least one previous slide, preview the next topic, "
-        "and use a choice assessment with correctFeedback and incorrectFeedback.\n"
-        "Checkpoint rules:\n"
-        "- Every assessment prompt must reference details from the slide body.\n"
-        "- Choice checkpoints must provide exactly three options labelled in plain text and set the correct answerIndex.\n"
-        '- Mention the "tutor" or "chat" to encourage the learner to share their response.\n'
-        f"Each slide body should contain approximately {body_range} words using paragraphs and, when helpful, bullet or numbered lists. "
-        "The overview must contain 3-4 sentences, and learning objectives should be three concise, action-oriented statements. "
-        "Respond concisely so the tool output fits within the schema. "
-        f"{compact_guidance}"
+    blocks = [{"text": _SLIDE_STATIC_INSTRUCTIONS}, _CACHE_POINT, {"text": volatile}]
+    if compact:
+        blocks.append({"text": _SLIDE_COMPACT_SUFFIX})
+    return blocks
+
+
+# Static instruction tier of the practice prompt; see the slide prompt note.
+_PRACTICE_STATIC_INSTRUCTIONS = (
+    "Generate one formative assessment MCQ for the subject and topic given below, based strictly on the lesson content that follows.\n"
+    "Write the question and options in the learner's language. Provide three concise options, mark the correct option, and craft specific feedback for both correct and incorrect answers. "
+    "Keep the wording culturally relevant to the learner's country."
+)
+
+_PRACTICE_CONTEXT_TEMPLATE = (
+    "Subject: {subject}\n"
+    "Topic: {topic}\n"
+    "Learner country: {country}. Learner language: {language}. Grade level: {grade}.\n"
+    "Lesson overview:\n"
+    "{overview}\n"
+    "Learning objectives:\n"
+    "{objectives_text}\n"
+    "Slide details:\n"
+    "{slide_summaries}"
+)
+
+
+def _build_bundle_prompt(request: LessonRequest, grade: str) -> list[dict]:
+    volatile = _SLIDE_VOLATILE_TEMPLATE.format(
+        subject=request.subject,
+        topic=request.topic,
+        country=request.country,
+        language=request.language,
+        grade=grade,
+        planning_sentence=_SLIDE_PLANNING_NORMAL,
+        body_range="160-210",
     )
+    return [{"text": _BUNDLE_STATIC_INSTRUCTIONS}, _CACHE_POINT, {"text": volatile}]
 
 
 def _build_practice_prompt(
@@ -200,26 +317,32 @@ def _build_practice_prompt(
     slide_summaries: str,
     *,
     compact: bool = False,
-) -> str:
-    concise_guidance = (
-        ""
-        if not compact
-        else "Keep the question and feedback succinct (ideally under 80 tokens total) while remaining specific."
+) -> list[dict]:
+    lesson_context = _PRACTICE_CONTEXT_TEMPLATE.format(
+        subject=request.subject,
+        topic=request.topic,
+        country=request.country,
+        language=request.language,
+        grade=grade,
+        overview=overview,
+        objectives_text=objectives_text,
+        slide_summaries=slide_summaries,
     )
 
-    return (
-        f"Generate one formative assessment MCQ for {request.subject} on the topic {request.topic}.\n"
-        f"Learner country: {request.country}. Learner language: {request.language}. Grade level: {grade}.\n"
-        "Base it on this lesson overview:\n"
-        f"{overview}\n"
-        "Learning objectives:\n"
-        f"{objectives_text}\n"
-        "Slide details:\n"
-        f"{slide_summaries}\n\n"
-        "Write the question and options in the learner's language. Provide three concise options, mark the correct option, and craft specific feedback for both correct and incorrect answers. "
-        "Keep the wording culturally relevant to the learner's country. "
-        f"{concise_guidance}"
-    )
+    blocks = [{"text": _PRACTICE_STATIC_INSTRUCTIONS}, _CACHE_POINT, {"text": lesson_context}]
+    if compact:
+        # Trailing block so the compact retry reuses the cached prefix.
+        blocks.append(
+            {"text": "Keep the question and feedback succinct (ideally under 80 tokens total) while remaining specific."}
+        )
+    return blocks
+
+
+# Sanitized slide payloads keyed by the request fields that shape them, so
+# repeated generation of the same lesson (curriculum backfills, retries after
+# a practice failure) skips the slide LLM call entirely.
+_SLIDE_CACHE_MAX = 512
+_slide_cache: OrderedDict[tuple, LessonSlidesPayload] = OrderedDict()
 
 
 async def _generate_slide_payload(
@@ -230,11 +353,18 @@ async def _generate_slide_payload(
 ) -> LessonSlidesPayload:
     grade = request.grade_level or "middle school"
     token_limit = max_tokens if max_tokens is not None else runtime.settings.lesson_slide_max_tokens
+
+    cache_key = (request.subject, request.topic, request.country, request.language, grade, token_limit)
+    cached = _slide_cache.get(cache_key)
+    if cached is not None:
+        _slide_cache.move_to_end(cache_key)
+        return cached
+
     try:
         slides = await runtime.structured_output(
             LessonSlidesPayload,
             _build_slide_prompt(request, grade),
-            system_prompt=LESSON_SYSTEM_PROMPT,
+            system_prompt=_LESSON_SYSTEM_BLOCKS,
             max_tokens=token_limit,
         )
     except ValueError as exc:
@@ -245,11 +375,38 @@ async def _generate_slide_payload(
         slides = await runtime.structured_output(
             LessonSlidesPayload,
             _build_slide_prompt(request, grade, compact=True),
-            system_prompt=LESSON_SYSTEM_PROMPT,
+            system_prompt=_LESSON_SYSTEM_BLOCKS,
             max_tokens=token_limit,
         )
 
-    return _sanitize_slide_payload(slides)
+    sanitized = _sanitize_slide_payload(slides)
+    _slide_cache[cache_key] = sanitized
+    while len(_slide_cache) > _SLIDE_CACHE_MAX:
+        _slide_cache.popitem(last=False)
+    return sanitized
+
+
+# Rendered slide summaries keyed by payload identity, so a compact retry or a
+# second practice attempt against the same payload does not rebuild the
+# multi-kilobyte string. Entries evaporate with their payload via weakref
+# finalizers (non-frozen pydantic models are unhashable, ruling out a
+# WeakKeyDictionary).
+_slide_summary_cache: Dict[int, str] = {}
+
+
+def _summarize_slides(slides_payload: LessonSlidesPayload) -> str:
+    key = id(slides_payload)
+    cached = _slide_summary_cache.get(key)
+    if cached is None:
+        cached = "\n\n".join(
+            [
+                f"Slide {idx + 1} ({slide.slide_type} - {slide.title}):\n{slide.body_md}"
+                for idx, slide in enumerate(slides_payload.slides)
+            ]
+        )
+        _slide_summary_cache[key] = cached
+        weakref.finalize(slides_payload, _slide_summary_cache.pop, key, None)
+    return cached
 
 
 async def _generate_practice_payload(
@@ -260,17 +417,17 @@ async def _generate_practice_payload(
     max_tokens: Optional[int] = None,
 ) -> LessonPracticePayload:
     grade = request.grade_level or "middle school"
-    overview = _normalize_text(slides_payload.overview)
-    objectives = [_normalize_text(obj) for obj in slides_payload.learning_objectives if obj.strip()]
+    # Every caller hands in a payload that already went through
+    # _sanitize_slide_payload, so the fields are normalized; re-running
+    # _normalize_text here was pure duplicate work.
+    overview = slides_payload.overview
+    objectives = [obj for obj in slides_payload.learning_objectives if obj]
     slides: List[LessonSlide] = list(slides_payload.slides)
 
     if not overview or not objectives or not slides:
         raise ValueError("Practice generation requires non-empty lesson overview, objectives, and slides")
 
-    slide_summaries = "\n\n".join(
-        f"Slide {idx + 1} ({slide.slide_type} - {slide.title}):\n{slide.body_md}"
-        for idx, slide in enumerate(slides)
-    )
+    slide_summaries = _summarize_slides(slides_payload)
     objectives_text = "\n".join(objectives)
 
     token_limit = max_tokens if max_tokens is not None else runtime.settings.lesson_practice_max_tokens
@@ -279,7 +436,7 @@ async def _generate_practice_payload(
         practice = await runtime.structured_output(
             LessonPracticePayload,
             _build_practice_prompt(request, grade, overview, objectives_text, slide_summaries),
-            system_prompt=PRACTICE_SYSTEM_PROMPT,
+            system_prompt=_PRACTICE_SYSTEM_BLOCKS,
             max_tokens=token_limit,
         )
     except ValueError as exc:
@@ -297,28 +454,11 @@ async def _generate_practice_payload(
                 slide_summaries,
                 compact=True,
             ),
-            system_prompt=PRACTICE_SYSTEM_PROMPT,
+            system_prompt=_PRACTICE_SYSTEM_BLOCKS,
             max_tokens=token_limit,
         )
 
-    if len(practice.options) < 3:
-        raise ValueError("Practice generation returned insufficient options")
-    if not practice.question.strip():
-        raise ValueError("Practice generation returned empty question")
-
-    practice_options = [_normalize_text(option) for option in practice.options if option.strip()]
-    if len(practice_options) != 3:
-        raise ValueError("Practice generation must include exactly three options")
-
-    sanitized_practice = {
-        "question": _normalize_text(practice.question),
-        "options": practice_options,
-        "correct_option_index": practice.correct_option_index,
-        "correct_feedback": _normalize_text(practice.correct_feedback),
-        "incorrect_feedback": _normalize_text(practice.incorrect_feedback),
-    }
-
-    return LessonPracticePayload.model_validate(sanitized_practice)
+    return _sanitize_practice_payload(practice)
 
 
 def attach_practice_to_slides(
@@ -329,24 +469,19 @@ def attach_practice_to_slides(
     if not slides:
         return slides_payload
 
-    final_slide = slides[-1].model_dump()
-    final_slide["assessment"] = {
-        "type": "choice",
-        "prompt": practice_payload.question,
-        "options": practice_payload.options,
-        "answer_index": practice_payload.correct_option_index,
-        "correct_feedback": practice_payload.correct_feedback,
-        "incorrect_feedback": practice_payload.incorrect_feedback,
-    }
-    slides[-1] = LessonSlide.model_validate(final_slide)
-
-    return LessonSlidesPayload.model_validate(
-        {
-            "overview": slides_payload.overview,
-            "learningObjectives": slides_payload.learning_objectives,
-            "slides": [slide.model_dump(by_alias=True) for slide in slides],
-        }
+    # Both payloads were validated when parsed, so rebuild the final slide
+    # with model_copy/model_construct instead of dict round-trips.
+    final_assessment = LessonSlideAssessment.model_construct(
+        type="choice",
+        prompt=practice_payload.question,
+        options=practice_payload.options,
+        answer_index=practice_payload.correct_option_index,
+        correct_feedback=practice_payload.correct_feedback,
+        incorrect_feedback=practice_payload.incorrect_feedback,
     )
+    slides[-1] = slides[-1].model_copy(update={"assessment": final_assessment})
+
+    return slides_payload.model_copy(update={"slides": slides})
 
 
 def _build_slide_tool(runtime: StrandsRuntime, max_tokens_override: Optional[int]):
@@ -361,17 +496,29 @@ def _build_slide_tool(runtime: StrandsRuntime, max_tokens_override: Optional[int
         Returns:
             JSON string that matches LessonSlidesPayload with alias keys.
         """
-        request_payload = LessonRequest.model_validate(json.loads(request_json))
+        # Parse straight from the JSON text in pydantic-core, skipping the
+        # json.loads dict intermediate.
+        request_payload = LessonRequest.model_validate_json(request_json)
         slides_payload = await _generate_slide_payload(
             runtime,
             request_payload,
             max_tokens=max_tokens_override if max_tokens_override is not None else runtime.settings.lesson_slide_max_tokens,
         )
-        return json.dumps(slides_payload.model_dump(by_alias=True), ensure_ascii=False)
+        # pydantic-core serializes straight to JSON in Rust, skipping the
+        # dict intermediate and the pure-Python encoder.
+        return slides_payload.model_dump_json(by_alias=True)
 
     return slide_designer
 
 
+class _PracticeBuilderInput(BaseModel):
+    """Composite argument of the practice_builder tool, parsed in one
+    pydantic-core pass straight from the JSON text."""
+
+    request: LessonRequest
+    slides: LessonSlidesPayload
+
+
 def _build_practice_tool(runtime: StrandsRuntime, max_tokens_override: Optional[int]):
     @tool
     async def practice_builder(payload_json: str) -> str:
@@ -384,93 +531,214 @@ def _build_practice_tool(runtime: StrandsRuntime, max_tokens_override: Optional[
         Returns:
             JSON string that matches LessonPracticePayload with alias keys.
         """
-        payload = json.loads(payload_json)
-        request_payload = LessonRequest.model_validate(payload.get("request", {}))
-        slides_payload = LessonSlidesPayload.model_validate(payload.get("slides", {}))
+        payload = _PracticeBuilderInput.model_validate_json(payload_json)
         practice_payload = await _generate_practice_payload(
             runtime,
-            request_payload,
-            slides_payload,
+            payload.request,
+            payload.slides,
             max_tokens=max_tokens_override if max_tokens_override is not None else runtime.settings.lesson_practice_max_tokens,
         )
-        return json.dumps(practice_payload.model_dump(by_alias=True), ensure_ascii=False)
+        return practice_payload.model_dump_json(by_alias=True)
 
     return practice_builder
 
 
+# Decorated tool pairs per (runtime, token limits). @tool builds the tool
+# spec from the closure's signature and docstring, which is pure repeated
+# work per request; the closures themselves are stateless. Agents are still
+# constructed per request because they carry conversation state.
+_ORCHESTRATOR_TOOLS_MAX = 8
+_orchestrator_tools: OrderedDict[tuple, tuple] = OrderedDict()
+
+
+def _get_orchestrator_tools(
+    runtime: StrandsRuntime,
+    slide_max_tokens: Optional[int],
+    practice_max_tokens: Optional[int],
+) -> tuple:
+    key = (id(runtime), slide_max_tokens, practice_max_tokens)
+    tools = _orchestrator_tools.get(key)
+    if tools is None:
+        tools = (
+            _build_slide_tool(runtime, slide_max_tokens),
+            _build_practice_tool(runtime, practice_max_tokens),
+        )
+        _orchestrator_tools[key] = tools
+        while len(_orchestrator_tools) > _ORCHESTRATOR_TOOLS_MAX:
+            _orchestrator_tools.popitem(last=False)
+    else:
+        _orchestrator_tools.move_to_end(key)
+    return tools
+
+
 def _build_orchestrator(
     runtime: StrandsRuntime,
     *,
     slide_max_tokens: Optional[int],
     practice_max_tokens: Optional[int],
 ) -> Agent:
-    slide_tool = _build_slide_tool(runtime, slide_max_tokens)
-    practice_tool = _build_practice_tool(runtime, practice_max_tokens)
+    slide_tool, practice_tool = _get_orchestrator_tools(runtime, slide_max_tokens, practice_max_tokens)
     return runtime.make_agent(
-        system_prompt=ORCHESTRATOR_SYSTEM_PROMPT,
+        system_prompt=_ORCHESTRATOR_SYSTEM_BLOCKS,
         tools=[slide_tool, practice_tool],
         temperature=0.0,
         max_tokens=1024,
     )
 
 
+# Completed lessons keyed by the request fields that shape them. Topic/grade
+# combinations form a small finite set, so re-requests (revisits, page
+# reloads, curriculum backfills) are common; serving them from memory skips
+# both Bedrock calls. Entries expire after a day so content refreshes.
+_LESSON_CACHE_TTL_S = 24 * 60 * 60
+_LESSON_CACHE_MAX = 256
+_lesson_cache: OrderedDict[tuple, tuple] = OrderedDict()
+
+
+def _lesson_cache_get(key: tuple) -> Optional[Tuple[LessonAssets, LessonPractice]]:
+    entry = _lesson_cache.get(key)
+    if entry is None:
+        return None
+    expires, result = entry
+    if expires < time.monotonic():
+        del _lesson_cache[key]
+        return None
+    _lesson_cache.move_to_end(key)
+    return result
+
+
+def _lesson_cache_put(key: tuple, result: Tuple[LessonAssets, LessonPractice]) -> None:
+    _lesson_cache[key] = (time.monotonic() + _LESSON_CACHE_TTL_S, result)
+    while len(_lesson_cache) > _LESSON_CACHE_MAX:
+        _lesson_cache.popitem(last=False)
+
+
+async def _first_success(*tasks: "asyncio.Task") -> Any:
+    """Return the result of the first task to finish without an exception,
+    cancelling the rest; raises the last failure if every task fails."""
+    pending = set(tasks)
+    last_exc: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                if exc is None:
+                    return task.result()
+                logger.warning("Lesson generation path failed; continuing with the other", exc_info=exc)
+                last_exc = exc
+        assert last_exc is not None
+        raise last_exc
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
 async def generate_lesson_assets(
     runtime: StrandsRuntime,
     request: LessonRequest,
     *,
     slide_max_tokens: Optional[int] = None,
     practice_max_tokens: Optional[int] = None,
-) -> Tuple[Dict[str, object], Dict[str, object]]:
+) -> Tuple[LessonAssets, LessonPractice]:
     slide_token_limit = slide_max_tokens if slide_max_tokens is not None else runtime.settings.lesson_slide_max_tokens
     practice_token_limit = practice_max_tokens if practice_max_tokens is not None else runtime.settings.lesson_practice_max_tokens
 
-    orchestrator = _build_orchestrator(
-        runtime,
-        slide_max_tokens=slide_token_limit,
-        practice_max_tokens=practice_token_limit,
+    cache_key = (
+        request.subject,
+        request.topic,
+        request.country,
+        request.language,
+        request.grade_level,
+        slide_token_limit,
+        practice_token_limit,
     )
-    request_json = json.dumps(request.model_dump(by_alias=True), ensure_ascii=False)
+    cached = _lesson_cache_get(cache_key)
+    if cached is not None:
+        return cached
 
-    try:
+    async def run_orchestrator() -> Tuple[LessonSlidesPayload, LessonPracticePayload]:
+        orchestrator = _build_orchestrator(
+            runtime,
+            slide_max_tokens=slide_token_limit,
+            practice_max_tokens=practice_token_limit,
+        )
+        request_json = request.model_dump_json(by_alias=True)
         response = await orchestrator.structured_output_async(
             LessonAgentResponse,
             f"Lesson request JSON:\n{request_json}\nFollow the procedure above and return the final JSON.",
         )
-
-        slides_payload = _sanitize_slide_payload(response.slides)
-        practice_payload = _sanitize_practice_payload(response.practice)
-    except Exception as exc:  # noqa: BLE001
-        logger.exception("Orchestrator agent failed; falling back to direct tool calls")
-        slides_payload = await _generate_slide_payload(
+        return _sanitize_slide_payload(response.slides), _sanitize_practice_payload(response.practice)
+
+    async def run_bundled() -> Tuple[LessonSlidesPayload, LessonPracticePayload]:
+        grade = request.grade_level or "middle school"
+        bundle_limit = (
+            slide_token_limit + practice_token_limit
+            if slide_token_limit and practice_token_limit
+            else None
+        )
+        response = await runtime.structured_output(
+            LessonAgentResponse,
+            _build_bundle_prompt(request, grade),
+            system_prompt=_LESSON_SYSTEM_BLOCKS,
+            max_tokens=bundle_limit,
+        )
+        return _sanitize_slide_payload(response.slides), _sanitize_practice_payload(response.practice)
+
+    async def run_direct() -> Tuple[LessonSlidesPayload, LessonPracticePayload]:
+        # One bundled call first; the split slide→practice sequence remains
+        # as the fallback when the bundle comes back malformed or truncated.
+        try:
+            return await run_bundled()
+        except ValueError as exc:
+            logger.warning("Bundled lesson generation failed; falling back to split calls", exc_info=exc)
+        slides = await _generate_slide_payload(
             runtime,
             request,
             max_tokens=slide_token_limit,
         )
-        practice_payload = await _generate_practice_payload(
+        practice = await _generate_practice_payload(
             runtime,
             request,
-            slides_payload,
+            slides,
             max_tokens=practice_token_limit,
         )
+        return slides, practice
+
+    # The two tool calls are a deterministic sequence, so the direct path is
+    # primary: routing them through the Lesson Director agent spends an
+    # extra LLM round-trip (and its token budget) deciding to do what this
+    # function already knows. The orchestrator survives behind an opt-in
+    # flag, raced against the direct path as before for debugging.
+    if runtime.settings.lesson_use_orchestrator:
+        slides_payload, practice_payload = await _first_success(
+            asyncio.create_task(run_orchestrator()),
+            asyncio.create_task(run_direct()),
+        )
     else:
-        logger.debug("Orchestrator agent completed successfully")
+        slides_payload, practice_payload = await run_direct()
 
     slides_with_practice = attach_practice_to_slides(slides_payload, practice_payload)
 
-    return (
-        {
-            "overview": slides_with_practice.overview,
-            "learning_objectives": slides_with_practice.learning_objectives,
-            "slides": slides_with_practice.slides,
-        },
-        {
-            "question": practice_payload.question,
-            "options": practice_payload.options,
-            "answer_index": practice_payload.correct_option_index,
-            "correct_feedback": practice_payload.correct_feedback,
-            "incorrect_feedback": practice_payload.incorrect_feedback,
-        },
+    result = (
+        LessonAssets(
+            overview=slides_with_practice.overview,
+            learning_objectives=slides_with_practice.learning_objectives,
+            slides=list(slides_with_practice.slides),
+        ),
+        # practice_payload was already validated; model_construct just
+        # re-shapes it into the response schema.
+        LessonPractice.model_construct(
+            question=practice_payload.question,
+            options=practice_payload.options,
+            answer_index=practice_payload.correct_option_index,
+            correct_feedback=practice_payload.correct_feedback,
+            incorrect_feedback=practice_payload.incorrect_feedback,
+        ),
     )
+    _lesson_cache_put(cache_key, result)
+    return result
 
 
 async def generate_lesson_slides(